@@ -0,0 +1,167 @@
+"""
+Admin commands for Ashfall MUD
+"""
+
+from evennia import Command
+
+from world.resets import ZONE_RESETS
+from world.respawn import KINDS, RESPAWN_REGISTRY
+from world.zone_loader import ZoneSync, load_zone, zone_names
+
+
+class CmdRespawn(Command):
+    """
+    Manage respawn points
+    
+    Usage:
+        respawn
+        respawn set <kind> [<name>] = <room>
+        respawn clear <kind> [<name>]
+        
+    Kinds, in the order they are checked when a character dies:
+        character <character> - one character
+        faction <faction>     - characters of that faction
+        zone <zone>           - deaths in rooms of that zone
+        default               - everyone else
+        
+    <room> is a room name, a #dbref or 'here'.
+    """
+    
+    key = "respawn"
+    locks = "cmd:perm(Admin)"
+    help_category = "Admin"
+    
+    def func(self):
+        args = self.args.strip()
+        if not args:
+            self.list_points()
+            return
+            
+        action, _, rest = args.partition(" ")
+        if action == "set":
+            spec, _, room_name = rest.partition("=")
+            if not room_name.strip():
+                self.caller.msg("Usage: respawn set <kind> [<name>] = <room>")
+                return
+        elif action == "clear":
+            spec = rest
+        else:
+            self.caller.msg("Usage: respawn [set|clear] <kind> [<name>]")
+            return
+            
+        kind, _, name = spec.strip().partition(" ")
+        name = name.strip()
+        if kind not in KINDS:
+            self.caller.msg(f"Unknown kind '{kind}'. Use one of: {', '.join(KINDS)}")
+            return
+        if kind != 'default' and not name:
+            self.caller.msg(f"A {kind} respawn point needs a name.")
+            return
+        if kind == 'character':
+            character = self.caller.search(name, global_search=True)
+            if not character:
+                return
+            name = character.id
+            
+        if action == "clear":
+            if RESPAWN_REGISTRY.clear(kind, name):
+                self.caller.msg(f"Cleared the {kind} respawn point.")
+            else:
+                self.caller.msg(f"There is no such {kind} respawn point.")
+            return
+            
+        room_name = room_name.strip()
+        room = self.caller.location if room_name == "here" else self.caller.search(
+            room_name, global_search=True)
+        if not room:
+            return
+        RESPAWN_REGISTRY.set(kind, name, room)
+        self.caller.msg(f"Set the {kind} respawn point to {room.key} ({room.dbref}).")
+
+    def list_points(self):
+        points = RESPAWN_REGISTRY.points()
+        if not points:
+            self.caller.msg("No respawn points are set; characters respawn at home.")
+            return
+        lines = ["Respawn points:"]
+        for (kind, name), room in points:
+            lines.append(f"  {kind} {name}".rstrip() + f": {room.key} ({room.dbref})")
+        self.caller.msg("\n".join(lines))
+
+
+class CmdZone(Command):
+    """
+    List, load and sync zone files
+    
+    Usage:
+        zone
+        zone load <zone>
+        zone load all
+        zone diff <zone>
+        zone sync <zone>
+        
+    Loading creates whatever of the zone is missing in the world, so
+    zones can be loaded again after their files change. Spawns are then
+    restocked by the zone resets, while players are in the zone.
+    
+    Diff shows, and sync applies, every difference between a zone file
+    and the live world: new, changed and removed rooms, exits and items.
+    Sync runs in batches while the game goes on; players are left where
+    they are, so rooms they stand in are not deleted.
+    """
+    
+    key = "zone"
+    aliases = ["zones"]
+    locks = "cmd:perm(Admin)"
+    help_category = "Admin"
+    
+    def func(self):
+        action, _, name = self.args.strip().partition(" ")
+        names = zone_names()
+        if not action:
+            self.caller.msg("Zone files: " + (", ".join(names) or "none"))
+            return
+        name = name.strip().lower()
+        if action in ("diff", "sync") and name:
+            self.sync(name, apply=action == "sync")
+            return
+        if action != "load" or not name:
+            self.caller.msg("Usage: zone load <zone>|all, or zone diff|sync <zone>")
+            return
+            
+        for zone in (names if name == "all" else [name]):
+            try:
+                _, created = load_zone(zone)
+            except ValueError as err:
+                self.caller.msg(str(err))
+                return
+            self.caller.msg(f"Loaded zone {zone}: created {created} objects.")
+        ZONE_RESETS.load()
+
+    def sync(self, name, apply):
+        try:
+            sync = ZoneSync(name)
+        except ValueError as err:
+            self.caller.msg(str(err))
+            return
+        if not sync:
+            self.caller.msg(f"Zone {sync.zone} is up to date.")
+            return
+        self.caller.msg(sync.summary())
+        if not apply:
+            return
+            
+        from twisted.internet import task
+        caller = self.caller
+        
+        def done(_):
+            ZONE_RESETS.load()
+            caller.msg(f"Synced zone {sync.zone}.")
+            if sync.skipped:
+                caller.msg("Left alone because of players: "
+                           + ", ".join(f"{obj.key} ({obj.dbref})" for obj in sync.skipped))
+                           
+        def failed(failure):
+            caller.msg(f"Syncing zone {sync.zone} failed: {failure.getErrorMessage()}")
+            
+        task.cooperate(sync.batches()).whenDone().addCallbacks(done, failed)
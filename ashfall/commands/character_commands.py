@@ -6,6 +6,8 @@ from evennia import Command
 from evennia.utils import create, search
 from django.conf import settings
 
+from world.classes import CLASSES
+
 
 class CmdChooseClass(Command):
     """
@@ -29,14 +31,13 @@ class CmdChooseClass(Command):
     def func(self):
         if not self.args:
             self.caller.msg("Usage: chooseclass <class>")
-            self.caller.msg("Available classes: warrior, mage, cleric, thief, psionicist")
+            self.caller.msg(f"Available classes: {', '.join(CLASSES)}")
             return
             
         class_name = self.args.lower().strip()
-        valid_classes = ['warrior', 'mage', 'cleric', 'thief', 'psionicist']
         
-        if class_name not in valid_classes:
-            self.caller.msg(f"Invalid class. Available classes: {', '.join(valid_classes)}")
+        if class_name not in CLASSES:
+            self.caller.msg(f"Invalid class. Available classes: {', '.join(CLASSES)}")
             return
             
         if self.caller.get_class_name() != "None":
@@ -167,32 +168,21 @@ class CmdClasses(Command):
     locks = "cmd:all()"
     
     def func(self):
-        self.caller.msg("""
-Available Starting Classes:
-
-Warrior - Strong fighters with high hit points and combat abilities
-  +2 Strength, +1 Constitution, +20 HP
-  Advanced: Warlord, Juggernaut
-
-Mage - Masters of magic with high intelligence and mana
-  +3 Intelligence, +50 Mana
-  Advanced: Warlock, Arcanist
-
-Cleric - Divine spellcasters with wisdom and healing abilities
-  +3 Wisdom, +30 Mana, +10 HP
-  Advanced: Inquisitor, Hierophant
-
-Thief - Agile rogues with high dexterity and stealth
-  +3 Dexterity, +10 HP
-  Advanced: Assassin, Ashstalker
-
-Psionicist - Mentalists with psychic powers and balanced stats
-  +2 Intelligence, +2 Wisdom, +40 Mana, +10 HP
-  Advanced: Mindreaver, Seer
-
-Use 'chooseclass <class>' to select your class.
-Use 'advancedclass <class>' to select advanced class (requires 50 remorts).
-""")
+        lines = ["", "Available Starting Classes:", ""]
+        for character_class in CLASSES.values():
+            gains = [f"+{value} {stat.capitalize()}" for stat, value in character_class.bonuses.items()]
+            if character_class.mana:
+                gains.append(f"+{character_class.mana} Mana")
+            if character_class.hit_points:
+                gains.append(f"+{character_class.hit_points} HP")
+            advanced = ", ".join(name.capitalize() for name in character_class.advanced)
+            lines.append(f"{character_class.key.capitalize()} - {character_class.description}")
+            lines.append(f"  {', '.join(gains)}")
+            lines.append(f"  Advanced: {advanced}")
+            lines.append("")
+        lines.append("Use 'chooseclass <class>' to select your class.")
+        lines.append("Use 'advancedclass <class>' to select advanced class (requires 50 remorts).")
+        self.caller.msg("\n".join(lines))
 
 
 class CmdRest(Command):
@@ -208,7 +198,7 @@ class CmdRest(Command):
     locks = "cmd:all()"
     
     def func(self):
-        if self.caller.db.is_combat:
+        if self.caller.combat.in_combat:
             self.caller.msg("You cannot rest while in combat!")
             return
             
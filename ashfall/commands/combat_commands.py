@@ -6,6 +6,10 @@ from evennia import Command
 from evennia.utils import search
 import random
 
+from world.equipment import SLOTS
+from world.skills import SKILLS
+from world.spells import SPELLS
+
 
 class CmdKill(Command):
     """
@@ -49,12 +53,12 @@ class CmdKill(Command):
             return
             
         # Check if already in combat
-        if self.caller.db.is_combat:
+        if self.caller.combat.in_combat:
             self.caller.msg("You are already in combat!")
             return
             
         # Start combat
-        self.caller.start_combat(target, weapon)
+        self.caller.combat.start(target, weapon)
         self.caller.msg(f"You attack {target.key}!")
         target.msg(f"{self.caller.key} attacks you!")
         self.caller.location.msg_contents(f"{self.caller.key} attacks {target.key}!", 
@@ -74,13 +78,13 @@ class CmdFlee(Command):
     locks = "cmd:all()"
     
     def func(self):
-        if not self.caller.db.is_combat:
+        if not self.caller.combat.in_combat:
             self.caller.msg("You are not in combat!")
             return
             
         # 50% chance to flee successfully
         if random.random() < 0.5:
-            self.caller.end_combat()
+            self.caller.combat.end()
             self.caller.msg("You successfully flee from combat!")
             self.caller.location.msg_contents(f"{self.caller.key} flees from combat!", 
                                             exclude=self.caller)
@@ -119,18 +123,7 @@ class CmdCast(Command):
             if not target:
                 return
         
-        # Check if character knows the spell
-        if spell_name not in self.caller.db.known_spells:
-            self.caller.msg(f"You don't know the spell '{spell_name}'.")
-            return
-            
-        # Check mana
-        spell_cost = self.caller.db.spells.get(spell_name, {}).get('cost', 10)
-        if self.caller.db.mana < spell_cost:
-            self.caller.msg("You don't have enough mana to cast that spell.")
-            return
-            
-        # Cast spell
+        # Cast spell; knowledge, mana and targeting are checked by the caster
         self.caller.cast_spell(spell_name, target)
 
 
@@ -148,22 +141,26 @@ class CmdSkills(Command):
     
     def func(self):
         skills = self.caller.db.skills or {}
-        spells = self.caller.db.known_spells or []
+        spells = self.caller.db.known_spells or ()
         
+        lines = []
         if skills:
-            self.caller.msg("Skills:")
-            for skill, level in skills.items():
-                self.caller.msg(f"  {skill}: {level}")
+            lines.append("Skills:")
+            for key, proficiency in sorted(skills.items()):
+                skill = SKILLS.get(key)
+                lines.append(f"  {skill.name if skill else key}: {proficiency}")
         else:
-            self.caller.msg("You have no skills.")
+            lines.append("You have no skills.")
             
         if spells:
-            self.caller.msg("\nKnown Spells:")
-            for spell in spells:
-                cost = self.caller.db.spells.get(spell, {}).get('cost', 10)
-                self.caller.msg(f"  {spell} (cost: {cost} mana)")
+            lines.append("\nKnown Spells:")
+            for key in sorted(spells):
+                spell = SPELLS.get(key)
+                if spell:
+                    lines.append(f"  {key} (cost: {spell.cost} mana)")
         else:
-            self.caller.msg("\nYou know no spells.")
+            lines.append("\nYou know no spells.")
+        self.caller.msg("\n".join(lines))
 
 
 class CmdWield(Command):
@@ -191,14 +188,13 @@ class CmdWield(Command):
             self.caller.msg("That's not a weapon!")
             return
             
-        # Unequip current weapon
-        if self.caller.db.equipment['wield']:
-            self.caller.db.equipment['wield'].move_to(self.caller.location)
-            self.caller.msg(f"You stop wielding {self.caller.db.equipment['wield'].key}.")
-            
-        # Equip new weapon
-        self.caller.db.equipment['wield'] = weapon
+        # Equip new weapon, unequipping the current one
         weapon.move_to(self.caller, quiet=True)
+        previous = self.caller.equipment.equip(weapon, 'wield')
+        if previous:
+            previous.move_to(self.caller.location)
+            self.caller.msg(f"You stop wielding {previous.key}.")
+            
         self.caller.msg(f"You wield {weapon.key}.")
         self.caller.location.msg_contents(f"{self.caller.key} wields {weapon.key}.", 
                                         exclude=self.caller)
@@ -216,12 +212,11 @@ class CmdUnwield(Command):
     locks = "cmd:all()"
     
     def func(self):
-        if not self.caller.db.equipment['wield']:
+        weapon = self.caller.equipment.unequip('wield')
+        if not weapon:
             self.caller.msg("You are not wielding anything.")
             return
             
-        weapon = self.caller.db.equipment['wield']
-        self.caller.db.equipment['wield'] = None
         weapon.move_to(self.caller.location)
         self.caller.msg(f"You stop wielding {weapon.key}.")
         self.caller.location.msg_contents(f"{self.caller.key} stops wielding {weapon.key}.", 
@@ -256,14 +251,13 @@ class CmdWear(Command):
         # Determine equipment slot
         slot = item.db.equipment_slot or "body"
         
-        # Unequip current item in slot
-        if self.caller.db.equipment[slot]:
-            self.caller.db.equipment[slot].move_to(self.caller.location)
-            self.caller.msg(f"You remove {self.caller.db.equipment[slot].key}.")
-            
-        # Equip new item
-        self.caller.db.equipment[slot] = item
+        # Equip new item, unequipping the current one in slot
         item.move_to(self.caller, quiet=True)
+        previous = self.caller.equipment.equip(item, slot)
+        if previous:
+            previous.move_to(self.caller.location)
+            self.caller.msg(f"You remove {previous.key}.")
+            
         self.caller.msg(f"You wear {item.key}.")
         self.caller.location.msg_contents(f"{self.caller.key} wears {item.key}.", 
                                         exclude=self.caller)
@@ -286,19 +280,17 @@ class CmdRemove(Command):
             self.caller.msg("Remove what?")
             return
             
-        item_name = self.args.lower()
-        
         # Find item in equipment
-        for slot, item in self.caller.db.equipment.items():
-            if item and item.key.lower() == item_name:
-                self.caller.db.equipment[slot] = None
-                item.move_to(self.caller.location)
-                self.caller.msg(f"You remove {item.key}.")
-                self.caller.location.msg_contents(f"{self.caller.key} removes {item.key}.", 
-                                                exclude=self.caller)
-                return
-                
-        self.caller.msg("You are not wearing that.")
+        slot, item = self.caller.equipment.find(self.args)
+        if not item:
+            self.caller.msg("You are not wearing that.")
+            return
+            
+        self.caller.equipment.unequip(slot)
+        item.move_to(self.caller.location)
+        self.caller.msg(f"You remove {item.key}.")
+        self.caller.location.msg_contents(f"{self.caller.key} removes {item.key}.", 
+                                        exclude=self.caller)
 
 
 class CmdEquipment(Command):
@@ -314,9 +306,9 @@ class CmdEquipment(Command):
     locks = "cmd:all()"
     
     def func(self):
-        self.caller.msg("Equipment:")
-        for slot, item in self.caller.db.equipment.items():
-            if item:
-                self.caller.msg(f"  {slot}: {item.key}")
-            else:
-                self.caller.msg(f"  {slot}: <empty>")
\ No newline at end of file
+        equipped = self.caller.equipment.items
+        lines = ["Equipment:"]
+        for slot in SLOTS:
+            item = equipped.get(slot)
+            lines.append(f"  {slot}: {item.key if item else '<empty>'}")
+        self.caller.msg("\n".join(lines))
\ No newline at end of file
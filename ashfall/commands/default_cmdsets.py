@@ -15,6 +15,7 @@ own cmdsets by inheriting from them or directly from `evennia.CmdSet`.
 """
 
 from evennia import default_cmds
+from .admin_commands import *
 from .character_commands import *
 from .combat_commands import *
 from .movement_commands import *
@@ -59,6 +60,8 @@ class CharacterCmdSet(default_cmds.CharacterCmdSet):
         # Movement and interaction commands
         self.add(CmdLook)
         self.add(CmdGo)
+        self.add(CmdTravel)
+        self.add(CmdSpeedwalk)
         self.add(CmdGet)
         self.add(CmdDrop)
         self.add(CmdInventory)
@@ -68,6 +71,10 @@ class CharacterCmdSet(default_cmds.CharacterCmdSet):
         self.add(CmdWho)
         self.add(CmdHelp)
         self.add(CmdQuit)
+        
+        # Admin commands
+        self.add(CmdRespawn)
+        self.add(CmdZone)
 
 
 class AccountCmdSet(default_cmds.AccountCmdSet):
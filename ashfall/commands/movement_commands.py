@@ -2,9 +2,41 @@
 Movement and basic interaction commands for Ashfall MUD
 """
 
+from django.conf import settings
 from evennia import Command
 from evennia.utils import search
 
+from world.navigation import (DIRECTION_NAMES, ROOM_GRAPH, normalize_direction,
+                              parse_speedwalk, reverse_direction)
+from world.wilderness import VirtualExit
+
+
+def traverse(character, exit):
+    """
+    Move character through exit without looking around. Wilderness exits
+    only take a room for their tile here.
+
+    Returns:
+        bool: If the character moved.
+    """
+    if isinstance(exit, VirtualExit):
+        return exit.at_traverse(character, look=False)
+    return bool(exit.destination) and character.move_to(exit.destination, look=False)
+
+
+def walk(character, directions):
+    """
+    Move character along directions, without looking around on the way.
+
+    Returns:
+        int: Steps taken; fewer than given if the way was blocked.
+    """
+    for steps, direction in enumerate(directions):
+        exit = character.location.exit_index.get(direction)
+        if not exit or not traverse(character, exit):
+            return steps
+    return len(directions)
+
 
 class CmdLook(Command):
     """
@@ -26,22 +58,21 @@ class CmdLook(Command):
             self.caller.msg(self.caller.location.return_appearance(self.caller))
             return
             
-        # Look at specific object or direction
+        # Look in a direction
+        direction = normalize_direction(self.args)
+        if direction:
+            exit = self.caller.location.exit_index.get(direction)
+            name = exit.destination_name if exit else None
+            if name:
+                self.caller.msg(f"You look {direction} and see {name}.")
+            else:
+                self.caller.msg(f"You look {direction} but see nothing special.")
+            return
+            
+        # Look at specific object; search reports failures itself
         target = self.caller.search(self.args)
         if target:
             self.caller.msg(target.return_appearance(self.caller))
-        else:
-            # Check if it's a direction
-            direction = self.args.lower()
-            if direction in ['north', 'south', 'east', 'west', 'up', 'down', 'n', 's', 'e', 'w', 'u', 'd']:
-                # Look in direction
-                exit = self.caller.location.exits.get(direction)
-                if exit:
-                    self.caller.msg(f"You look {direction} and see {exit.destination.key}.")
-                else:
-                    self.caller.msg(f"You look {direction} but see nothing special.")
-            else:
-                self.caller.msg(f"You don't see '{self.args}' here.")
 
 
 class CmdGo(Command):
@@ -54,7 +85,7 @@ class CmdGo(Command):
     """
     
     key = "go"
-    aliases = ["north", "south", "east", "west", "up", "down", "n", "s", "e", "w", "u", "d"]
+    aliases = list(DIRECTION_NAMES)
     locks = "cmd:all()"
     
     def func(self):
@@ -67,36 +98,102 @@ class CmdGo(Command):
             direction = self.cmdstring.lower()
             
         # Check if in combat
-        if self.caller.db.is_combat:
+        if self.caller.combat.in_combat:
             self.caller.msg("You cannot move while in combat!")
             return
             
-        # Find exit
-        exit = self.caller.location.exits.get(direction)
-        if not exit:
+        # Find exit and move
+        exit = self.caller.location.exit_index.get(direction)
+        if not exit or not traverse(self.caller, exit):
             self.caller.msg("You cannot go that way.")
             return
             
-        # Move
-        self.caller.move_to(exit.destination)
+        direction = normalize_direction(direction) or exit.key
         self.caller.msg(f"You go {direction}.")
-        self.caller.location.msg_contents(f"{self.caller.key} arrives from the {self.get_reverse_direction(direction)}.", 
+        reverse = reverse_direction(direction)
+        arrival = f"arrives from the {reverse}" if reverse else "arrives"
+        self.caller.location.msg_contents(f"{self.caller.key} {arrival}.", 
                                         exclude=self.caller)
         
         # Look at new location
         self.caller.msg(self.caller.location.return_appearance(self.caller))
+
+
+class CmdTravel(Command):
+    """
+    Travel to a room along the shortest known route
+    
+    Usage:
+        travel <room>
+    """
     
-    def get_reverse_direction(self, direction):
-        """Get reverse direction for arrival message"""
-        reverse_dirs = {
-            'north': 'south', 'south': 'north',
-            'east': 'west', 'west': 'east',
-            'up': 'down', 'down': 'up',
-            'n': 'south', 's': 'north',
-            'e': 'west', 'w': 'east',
-            'u': 'down', 'd': 'up'
-        }
-        return reverse_dirs.get(direction, 'unknown')
+    key = "travel"
+    locks = "cmd:all()"
+    
+    def func(self):
+        if not self.args:
+            self.caller.msg("Travel where?")
+            return
+            
+        if self.caller.combat.in_combat:
+            self.caller.msg("You cannot move while in combat!")
+            return
+            
+        room = self.caller.search(self.args.strip(), global_search=True,
+                                  typeclass="typeclasses.rooms.Room")
+        if not room:
+            return
+            
+        path = ROOM_GRAPH.find_path(self.caller.location.id, room.id)
+        if path is None:
+            self.caller.msg(f"You don't know a way to {room.key}.")
+            return
+        if not path:
+            self.caller.msg("You are already there.")
+            return
+            
+        steps = walk(self.caller, path)
+        if steps < len(path):
+            self.caller.msg(f"Your way is blocked after {steps} of {len(path)} steps.")
+        else:
+            self.caller.msg(f"You travel {', '.join(path)}.")
+        self.caller.msg(self.caller.location.return_appearance(self.caller))
+
+
+class CmdSpeedwalk(Command):
+    """
+    Walk several steps at once
+    
+    Usage:
+        speedwalk <route>
+        
+    A route is a list of directions, each optionally preceded by a
+    count, such as '3w2n' or '2ne, s'.
+    """
+    
+    key = "speedwalk"
+    locks = "cmd:all()"
+    
+    def func(self):
+        if not self.args:
+            self.caller.msg("Usage: speedwalk <route>, for example: speedwalk 3w2n")
+            return
+            
+        if self.caller.combat.in_combat:
+            self.caller.msg("You cannot move while in combat!")
+            return
+            
+        try:
+            path = parse_speedwalk(self.args, getattr(settings, 'SPEEDWALK_MAX_STEPS', 50))
+        except ValueError as err:
+            self.caller.msg(str(err))
+            return
+            
+        steps = walk(self.caller, path)
+        if steps < len(path):
+            self.caller.msg(f"You cannot go {path[steps]}; you stop after {steps} of "
+                            f"{len(path)} steps.")
+        self.caller.msg(self.caller.location.return_appearance(self.caller))
 
 
 class CmdGet(Command):
@@ -336,7 +433,7 @@ class CmdHelp(Command):
 Available commands:
   Character: chooseclass, stats, remort, advancedclass, level, classes
   Combat: kill, flee, cast, skills, wield, unwield, wear, remove, equipment
-  Movement: look, go, get, drop, inventory
+  Movement: look, go, travel, speedwalk, get, drop, inventory
   Social: say, shout, emote, who
   System: help, quit
   
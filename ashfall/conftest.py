@@ -0,0 +1,9 @@
+"""
+Pytest configuration for Ashfall MUD
+
+The tests in `tests/` cover the modules that need neither Evennia nor a
+database. `test_mud.py` is a script that builds the world in a real
+database, not a test module, so it is not collected.
+"""
+
+collect_ignore = ["test_mud.py"]
@@ -3,7 +3,7 @@ World initialization script for Ashfall MUD
 """
 
 from evennia import Script
-from world.ashfall_world import create_ashfall_world
+from world.zone_loader import load_all_zones
 
 
 class WorldInitScript(Script):
@@ -25,18 +25,10 @@ class WorldInitScript(Script):
         
     def at_start(self):
         """Called when script starts"""
-        # Check if world already exists
-        from evennia import search_object
-        
-        neighborhood = search_object("Ruined Neighborhood")
-        if neighborhood:
-            self.obj.msg("World already exists, skipping initialization.")
-            return
-            
-        # Create the world
-        self.obj.msg("Initializing Ashfall MUD world...")
-        starting_room = create_ashfall_world()
-        self.obj.msg(f"World initialized! Starting room: {starting_room.key}")
+        # Only what is missing is created, so this is safe on every start
+        self.obj.msg("Loading Ashfall MUD zones...")
+        created = load_all_zones()
+        self.obj.msg(f"World up to date, created {created} objects.")
         
         # Stop the script
         self.stop()
\ No newline at end of file
@@ -30,7 +30,14 @@ def at_server_start():
     This is called every time the server starts up, regardless of
     how it was shut down.
     """
-    pass
+    from world.navigation import ROOM_GRAPH
+    from world.resets import ZONE_RESETS
+    from world.respawn import RESPAWN_REGISTRY
+    from world.wilderness import WILDERNESS
+    RESPAWN_REGISTRY.load()
+    ROOM_GRAPH.load()
+    WILDERNESS.load()
+    ZONE_RESETS.load()
 
 
 def at_server_stop():
@@ -38,7 +45,8 @@ def at_server_stop():
     This is called just before the server is shut down, regardless
     of it is for a reload, reset or shutdown.
     """
-    pass
+    from world.statblock import flush_stats
+    flush_stats()
 
 
 def at_server_reload_start():
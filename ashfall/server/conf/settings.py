@@ -49,9 +49,23 @@ MAX_NR_CHARACTERS = 1  # One character per account initially
 IN_GAME_TIME_FACTOR = 1.0  # Real time = game time
 
 # Combat settings
-COMBAT_TIMEOUT = 30  # Seconds before combat times out
+COMBAT_TIMEOUT = 30  # Seconds per combat round
+REGEN_INTERVAL = 10  # Seconds per regeneration tick
+STAT_FLUSH_INTERVAL = 5  # Max seconds of hit point/mana/move/exp changes a crash can lose
 COMBAT_ANNOUNCE_ROUNDS = True
 
+# Zone resets
+ZONE_RESET_TICK = 30  # Seconds between checks for due spawns
+ZONE_RESET_INTERVAL = 600  # Seconds between resets of spawns that set no interval
+
+# Wilderness grid around the zones
+WILDERNESS_SEED = 1
+WILDERNESS_SIZE = (1000, 1000)  # Width and height in tiles
+WILDERNESS_POOL_SIZE = 20  # Spare rooms kept for tiles characters walk onto
+
+# Movement
+SPEEDWALK_MAX_STEPS = 50  # Most steps one speedwalk may take
+
 # Experience and leveling
 BASE_EXP_GAIN = 100
 LEVEL_EXP_MULTIPLIER = 1.2
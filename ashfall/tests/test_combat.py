@@ -0,0 +1,103 @@
+"""Tests for world.combat, with stub characters"""
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("evennia")
+
+from world import combat  # noqa: E402
+from world.dice import compile_dice  # noqa: E402
+
+
+class StubAttributes:
+    def has(self, name):
+        return False
+
+
+class StubCharacter:
+    """Just enough of a Character for the engine and the handler"""
+
+    def __init__(self, key):
+        self.key = key
+        self.ndb = SimpleNamespace(combat_target=None, combat_weapon=None)
+        self.attributes = StubAttributes()
+        self.combat = combat.CombatHandler(self)
+        self.attacked = []
+
+    def get_attack_stats(self):
+        return 100, compile_dice("1d1"), 0, 10
+
+    def get_armor_class(self):
+        return 0
+
+    def deliver_attack(self, target, damage):
+        self.attacked.append(target)
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    """A fresh engine that does not subscribe a ticker"""
+    engine = combat.CombatEngine()
+    monkeypatch.setattr(engine, 'update_ticker', lambda: None)
+    monkeypatch.setattr(combat, 'COMBAT_ENGINE', engine)
+    return engine
+
+
+@pytest.fixture
+def brawl(engine):
+    """A and C both attack B"""
+    a, b, c = StubCharacter("A"), StubCharacter("B"), StubCharacter("C")
+    a.combat.start(b)
+    c.combat.start(b)
+    return a, b, c
+
+
+def test_start_registers_the_fight(brawl, engine):
+    a, b, c = brawl
+    assert engine.fights == {a: b, c: b}
+    assert b.combat.target is a
+    assert all(character.combat.in_combat for character in brawl)
+
+
+def test_other_attacker_ending_keeps_the_fight(brawl, engine):
+    a, b, c = brawl
+    c.combat.end()
+    assert engine.fights == {a: b}
+    assert not c.combat.in_combat
+    assert a.combat.target is b
+    assert b.combat.target is a
+    engine.resolve_round()
+    assert a.attacked == [b]
+
+
+def test_opponent_ending_ends_the_other_fights_next_round(brawl, engine):
+    a, b, c = brawl
+    a.combat.end()
+    assert engine.fights == {c: b}
+    assert not a.combat.in_combat
+    assert not b.combat.in_combat
+    engine.resolve_round()
+    assert engine.fights == {}
+    assert not c.combat.in_combat
+    assert c.attacked == []
+
+
+def test_target_fighting_back(engine):
+    a, b = StubCharacter("A"), StubCharacter("B")
+    b.combat.start(a)
+    a.combat.start(b)
+    assert engine.fights == {a: b, b: a}
+    b.combat.end()
+    assert engine.fights == {}
+    assert not a.combat.in_combat
+    assert not b.combat.in_combat
+
+
+def test_failing_attacker_leaves_combat(brawl, engine):
+    a, b, c = brawl
+    c.get_attack_stats = None
+    engine.resolve_round()
+    assert engine.fights == {a: b}
+    assert not c.combat.in_combat
+    assert a.attacked == [b]
@@ -0,0 +1,62 @@
+"""Tests for world.dice"""
+
+import random
+
+import pytest
+
+from world.dice import MAX_EXPLOSIONS, compile_dice, roll, roll_many
+
+
+def test_compile_dice_is_cached():
+    assert compile_dice("2d8+3") is compile_dice("2d8+3")
+
+
+@pytest.mark.parametrize("expression, minimum, maximum", [
+    ("2d8+3", 5, 19),
+    ("d20", 1, 20),
+    ("4d6kh3", 3, 18),
+    ("2d20kl1", 1, 20),
+    ("1d6-1d4", -3, 5),
+    ("5", 5, 5),
+])
+def test_compile_dice_bounds(expression, minimum, maximum):
+    dice = compile_dice(expression)
+    assert (dice.minimum, dice.maximum) == (minimum, maximum)
+
+
+def test_simple_terms_only_for_plain_dice():
+    assert compile_dice("2d8+1d4+2").simple_terms == ((2, 8), (1, 4))
+    assert compile_dice("4d6kh3").simple_terms is None
+    assert compile_dice("3d6!").simple_terms is None
+    assert compile_dice("1d6-1d4").simple_terms is None
+
+
+@pytest.mark.parametrize("expression", ["", "  ", "2x6", "d", "0d6", "1d0", "2d6 3", "1d1!"])
+def test_compile_dice_rejects_bad_syntax(expression):
+    with pytest.raises(ValueError):
+        compile_dice(expression)
+
+
+@pytest.mark.parametrize("expression", ["2d8+3", "4d6kh3", "2d20kl1", "1d6-1d4"])
+def test_roll_stays_in_bounds(expression):
+    dice = compile_dice(expression)
+    rng = random.Random(1)
+    for _ in range(500):
+        assert dice.minimum <= dice.roll(rng) <= dice.maximum
+
+
+def test_exploding_dice_are_capped():
+    rng = random.Random(2)
+    for _ in range(500):
+        assert 1 <= roll("1d2!", rng) <= 2 * (MAX_EXPLOSIONS + 1)
+
+
+def test_roll_is_reproducible_with_a_seed():
+    first = [roll("3d6!+1d4", random.Random(7)) for _ in range(3)]
+    second = [roll("3d6!+1d4", random.Random(7)) for _ in range(3)]
+    assert first == second
+
+
+def test_roll_many_mixes_strings_and_compiled():
+    results = roll_many(["1d1+4", compile_dice("2d1"), "3"], random.Random(0))
+    assert results == [5, 2, 3]
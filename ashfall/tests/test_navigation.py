@@ -0,0 +1,35 @@
+"""Tests for world.navigation"""
+
+import pytest
+
+from world.navigation import normalize_direction, parse_speedwalk, reverse_direction
+
+
+@pytest.mark.parametrize("text, path", [
+    ("n", ["north"]),
+    ("3w2n", ["west"] * 3 + ["north"] * 2),
+    ("2 ne, s", ["northeast", "northeast", "south"]),
+    (" U D ", ["up", "down"]),
+    ("2sw1e", ["southwest", "southwest", "east"]),
+])
+def test_parse_speedwalk(text, path):
+    assert parse_speedwalk(text) == path
+
+
+@pytest.mark.parametrize("text", ["3x", "north", "2", "n;s"])
+def test_parse_speedwalk_rejects_bad_input(text):
+    with pytest.raises(ValueError):
+        parse_speedwalk(text)
+
+
+def test_directions():
+    assert normalize_direction("NE") == "northeast"
+    assert reverse_direction("up") == "down"
+
+
+def test_parse_speedwalk_caps_the_path_length():
+    assert len(parse_speedwalk("10n", max_steps=10)) == 10
+    assert len(parse_speedwalk("5n5s", max_steps=10)) == 10
+    for text in ("11n", "5n6s", "99999999n", "9" * 5000 + "n"):
+        with pytest.raises(ValueError, match="at most 10 steps"):
+            parse_speedwalk(text, max_steps=10)
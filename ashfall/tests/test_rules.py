@@ -0,0 +1,82 @@
+"""Tests for world.rules"""
+
+import random
+
+import pytest
+
+from world import rules
+from world.dice import compile_dice
+
+ATTACKS = (
+    [0, 200, -200, 0, 10, 200],                    # hit bonus
+    [0, 0, 0, 0, 5, 0],                            # armor class
+    [compile_dice(expression) for expression in
+     ("1d8", "2d6+1", "1d4", "4d6kh3", "3d6!", "1d1-5")],
+    [0, 2, 0, 1, 0, 0],                            # damage bonus
+    [10, 14, 10, 18, 10, 10],                      # strength
+)
+
+
+@pytest.fixture(params=["numpy", "python"])
+def engine(request, monkeypatch):
+    """Run a test once with the NumPy path and once with the fallback"""
+    if request.param == "numpy":
+        if rules.np is None:
+            pytest.skip("NumPy is not installed")
+        return rules.np.random.default_rng
+    monkeypatch.setattr(rules, 'np', None)
+    return random.Random
+
+
+def test_resolve_attack_hits_and_misses():
+    rng = random.Random(3)
+    dice = compile_dice("1d6")
+    assert rules.resolve_attack(-100, 0, dice, 0, 10, rng=rng) == 0
+    for _ in range(100):
+        assert 1 + 2 <= rules.resolve_attack(100, 0, dice, 0, 14, rng=rng) <= 6 + 2
+
+
+def test_resolve_attack_does_at_least_one_damage():
+    assert rules.resolve_attack(100, 0, compile_dice("1d1"), -10, 10, rng=random.Random()) == 1
+
+
+def test_resolve_attacks_empty(engine):
+    assert rules.resolve_attacks([], [], [], [], [], rng=engine(0)) == []
+
+
+def test_resolve_attacks_bounds(engine):
+    rng = engine(4)
+    for _ in range(200):
+        damage = rules.resolve_attacks(*ATTACKS, rng=rng)
+        assert len(damage) == 6
+        assert all(isinstance(value, int) for value in damage)
+        assert 1 + 2 + 2 + 1 <= damage[1] <= 13 + 2 + 2
+        assert damage[2] == 0
+        assert 3 + 1 + 4 <= damage[3] <= 18 + 1 + 4 or damage[3] == 0
+        assert damage[5] == 1
+
+
+def test_resolve_attacks_is_reproducible_with_a_seed(engine):
+    first = [rules.resolve_attacks(*ATTACKS, rng=engine(5)) for _ in range(3)]
+    second = [rules.resolve_attacks(*ATTACKS, rng=engine(5)) for _ in range(3)]
+    assert first == second
+
+
+def test_resolve_attacks_adds_bonuses(engine):
+    damage = rules.resolve_attacks([200], [0], [compile_dice("2d1+1")], [2], [16], rng=engine(6))
+    assert damage == [3 + 2 + 3]
+
+
+def test_level_for_experience():
+    table = rules.exp_table(10)
+    assert rules.level_for_experience(table, 0) == 1
+    assert rules.level_for_experience(table, table[2] - 1) == 1
+    assert rules.level_for_experience(table, table[2]) == 2
+    assert rules.level_for_experience(table, table[5] + 1) == 5
+    assert rules.level_for_experience(table, 10 ** 9) == 10
+
+
+def test_exp_table_matches_exp_for_level():
+    table = rules.exp_table(20, 1.5)
+    assert table == tuple(rules.exp_for_level(level, 1.5) for level in range(21))
+    assert rules.exp_table(20, 1.5) is table
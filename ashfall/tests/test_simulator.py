@@ -0,0 +1,33 @@
+"""Tests for world.simulator"""
+
+from world import simulator
+
+SMALL_RUN = dict(fights=20, level=5, duels=4, progression=3, max_level=10, remorts=1)
+
+
+def test_seeded_runs_give_the_same_results():
+    first = simulator.run(seed=1, **SMALL_RUN)
+    second = simulator.run(seed=1, **SMALL_RUN)
+    assert first['combat']['rounds'] == second['combat']['rounds']
+    assert first['balance'] == second['balance']
+
+
+def test_win_rates_are_rates():
+    report = simulator.run(seed=2, **SMALL_RUN)
+    for group in report['balance'].values():
+        assert group
+        assert all(0.0 <= rate <= 1.0 for rate in group.values())
+
+
+def test_check_reports_missed_thresholds():
+    report = simulator.run(seed=3, **SMALL_RUN)
+    assert simulator.check(report) == []
+    assert simulator.check(report, min_fights_per_sec=float('inf'))
+    assert simulator.check(report, max_win_rate=-1)
+
+
+def test_main_exit_status():
+    args = ["--fights", "5", "--duels", "1", "--progression", "1", "--max-level", "5",
+            "--seed", "1", "--json"]
+    assert simulator.main(args) == 0
+    assert simulator.main(args + ["--min-fights-per-sec", "1e12"]) == 1
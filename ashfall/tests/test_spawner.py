@@ -0,0 +1,65 @@
+"""Tests for world.spawner"""
+
+import pytest
+
+from world import spawner
+
+
+def test_module_prototypes_resolve():
+    assert 'rusty_pipe' in spawner.PROTOTYPES
+    assert 'weapon' in spawner.PROTOTYPES
+    assert all('prototype_parent' not in prototype
+               for prototype in spawner.PROTOTYPES.values())
+
+
+def test_child_inherits_and_overrides_parent_attrs():
+    attrs = {attr[0]: attr[1] for attr in spawner.PROTOTYPES['energy_cell']['attrs']}
+    assert attrs['ammo_type'] == "energy"
+    assert attrs['quantity'] == 5
+    assert spawner.PROTOTYPES['energy_cell']['typeclass'] == "typeclasses.items.Ammo"
+    attrs = {attr[0]: attr[1] for attr in spawner.PROTOTYPES['rusty_pipe']['attrs']}
+    assert attrs['damage_dice'] == "1d8"
+    assert attrs['hit_bonus'] == 0
+
+
+def test_resolve_merges_parents_in_order():
+    resolved = spawner.resolve_prototypes({
+        'base': {'typeclass': "a.B", 'tags': [("old", "kind")], 'color': "red", 'size': 1},
+        'mixin': {'size': 2, 'tags': [("new", "kind")]},
+        'child': {'prototype_parent': ("BASE", "MIXIN"), 'key': "thing", 'color': "blue"},
+    })
+    child = resolved['child']
+    attrs = {attr[0]: attr[1] for attr in child['attrs']}
+    assert attrs == {'color': "blue", 'size': 2}
+    assert sorted(child['tags']) == [("new", "kind", None), ("old", "kind", None)]
+    assert child['prototype_key'] == "child"
+    assert child['typeclass'] == "a.B"
+
+
+@pytest.mark.parametrize("prototypes", [
+    {'a': {'prototype_parent': "missing", 'typeclass': "a.B"}},
+    {'a': {'prototype_parent': "b"}, 'b': {'prototype_parent': "a"}},
+    {'a': {'key': "no typeclass"}},
+    {'a': {'typeclass': "a.B", 'attrs': [("only a name",)]}},
+])
+def test_resolve_rejects_bad_prototypes(prototypes):
+    with pytest.raises(ValueError):
+        spawner.resolve_prototypes(prototypes)
+
+
+def test_get_prototype_returns_a_copy():
+    prototype = spawner.get_prototype("RUSTY_PIPE")
+    prototype['attrs'].append(("broken", True, None, ""))
+    assert ("broken", True, None, "") not in spawner.PROTOTYPES['rusty_pipe']['attrs']
+
+
+def test_parents_cannot_be_spawned():
+    with pytest.raises(ValueError):
+        spawner.get_prototype("WEAPON")
+    with pytest.raises(ValueError):
+        spawner.get_prototype("NO_SUCH_ITEM")
+
+
+def test_exec_is_rejected():
+    with pytest.raises(ValueError, match="exec"):
+        spawner.resolve_prototypes({'a': {'typeclass': "a.B", 'exec': "print(1)"}})
@@ -7,8 +7,11 @@ for allowing Characters to traverse the exit to its destination.
 
 """
 
+from evennia.objects.models import ObjectDB
 from evennia.objects.objects import DefaultExit
 
+from world.navigation import ROOM_GRAPH, invalidate_exits
+
 from .objects import ObjectParent
 
 
@@ -23,4 +26,36 @@ class Exit(ObjectParent, DefaultExit):
 
     """
 
-    pass
+    def at_post_move(self, source_location, **kwargs):
+        """Keep the exit indexes and the room graph current"""
+        super().at_post_move(source_location, **kwargs)
+        invalidate_exits(source_location)
+        invalidate_exits(self.location)
+        ROOM_GRAPH.update_exit(self)
+
+    def at_rename(self, oldname, newname):
+        """Keep the exit index and the room graph current"""
+        super().at_rename(oldname, newname)
+        invalidate_exits(self.location)
+        ROOM_GRAPH.update_exit(self)
+
+    def at_object_delete(self):
+        """Keep the exit index and the room graph current"""
+        invalidate_exits(self.location)
+        ROOM_GRAPH.remove_exit(self)
+        return super().at_object_delete()
+
+    @property
+    def destination_name(self):
+        """Name of where the exit leads, for looking through it"""
+        return self.destination.key if self.destination else None
+
+    def _get_destination(self):
+        return ObjectDB.destination.fget(self)
+
+    def _set_destination(self, destination):
+        ObjectDB.destination.fset(self, destination)
+        ROOM_GRAPH.update_exit(self)
+
+    # re-targeting an exit updates the room graph
+    destination = property(_get_destination, _set_destination, ObjectDB.destination.fdel)
@@ -1,8 +1,14 @@
 """
 Items and equipment for Ashfall MUD
+
+New items are spawned from the prototypes in `world.prototypes`, which set
+their stats on these base typeclasses. The item subclasses below remain
+for the objects already created with them.
 """
 
 from evennia.objects.objects import DefaultObject
+from world.dice import compile_dice
+
 from .objects import ObjectParent
 
 
@@ -21,6 +27,11 @@ class Weapon(ObjectParent, DefaultObject):
         self.db.durability = 100
         self.db.max_durability = 100
 
+    @property
+    def damage_roll(self):
+        """Compiled form of damage_dice, cached per expression string"""
+        return compile_dice(self.db.damage_dice or "1d6")
+
 
 class Armor(ObjectParent, DefaultObject):
     """
@@ -149,35 +160,44 @@ class CombatHelmet(PostApocArmor):
         self.db.max_durability = 70
 
 
+class Consumable(ObjectParent, DefaultObject):
+    """
+    Base class of items used up a use at a time
+    """
+
+    def at_object_creation(self):
+        super().at_object_creation()
+        self.tags.add("consumable")
+        self.db.uses = 1
+        self.db.max_uses = 1
+
+
 # Utility items
-class WaterCanteen(DefaultObject):
+class WaterCanteen(Consumable):
     """A water canteen"""
     
     def at_object_creation(self):
         super().at_object_creation()
-        self.tags.add("consumable")
         self.db.uses = 10
         self.db.max_uses = 10
         self.db.healing = 20
 
 
-class Medkit(DefaultObject):
+class Medkit(Consumable):
     """A medical kit"""
     
     def at_object_creation(self):
         super().at_object_creation()
-        self.tags.add("consumable")
         self.db.uses = 5
         self.db.max_uses = 5
         self.db.healing = 50
 
 
-class RadAway(DefaultObject):
+class RadAway(Consumable):
     """Radiation treatment medicine"""
     
     def at_object_creation(self):
         super().at_object_creation()
-        self.tags.add("consumable")
         self.db.uses = 3
         self.db.max_uses = 3
         self.db.radiation_healing = 30
@@ -10,6 +10,8 @@ with a location in the game world (like Characters, Rooms, Exits).
 
 from evennia.objects.objects import DefaultObject
 
+from world.appearance import is_thing
+
 
 class ObjectParent:
     """
@@ -22,6 +24,24 @@ class ObjectParent:
 
     """
 
+    def at_rename(self, oldname, newname):
+        """Refresh the contents list shown in the room"""
+        super().at_rename(oldname, newname)
+        _bump_contents(self)
+
+    def at_object_delete(self):
+        """Refresh the contents list shown in the room"""
+        _bump_contents(self)
+        return super().at_object_delete()
+
+
+def _bump_contents(obj):
+    if not is_thing(obj):
+        return
+    appearance = getattr(obj.location, 'appearance', None) if obj.location else None
+    if appearance is not None:
+        appearance.bump_contents()
+
 
 class Object(ObjectParent, DefaultObject):
     """
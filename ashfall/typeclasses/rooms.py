@@ -6,6 +6,11 @@ Rooms are simple containers that has no location of their own.
 """
 
 from evennia.objects.objects import DefaultRoom
+from evennia.utils.utils import delay, lazy_property
+
+from world.appearance import AppearanceCache, is_public, is_thing
+from world.navigation import ExitIndex
+from world.wilderness import WILDERNESS, WildernessExits
 
 from .objects import ObjectParent
 
@@ -21,4 +26,90 @@ class Room(ObjectParent, DefaultRoom):
     properties and methods available on all Objects.
     """
 
-    pass
+    @lazy_property
+    def exit_index(self):
+        """Exit lookup by key, alias and direction"""
+        return ExitIndex(self)
+
+    @lazy_property
+    def appearance(self):
+        """Cached appearance fragments"""
+        return AppearanceCache(self)
+
+    def at_object_receive(self, moved_obj, source_location, **kwargs):
+        """Mark the contents fragment stale if moved_obj is listed in it"""
+        super().at_object_receive(moved_obj, source_location, **kwargs)
+        if is_thing(moved_obj):
+            self.appearance.bump_contents()
+
+    def at_object_leave(self, moved_obj, target_location, **kwargs):
+        """Mark the contents fragment stale if moved_obj is listed in it"""
+        super().at_object_leave(moved_obj, target_location, **kwargs)
+        if is_thing(moved_obj):
+            self.appearance.bump_contents()
+
+    def _is_builder(self, looker):
+        return looker.locks.check_lockstring(looker, "perm(Builder)")
+
+    def get_display_desc(self, looker, **kwargs):
+        """Room description, cached until the description changes"""
+        return self.appearance.get(
+            'desc', self.db.desc,
+            lambda: (super(Room, self).get_display_desc(looker, **kwargs), True))
+
+    def get_display_exits(self, looker, **kwargs):
+        """Exit list, cached until an exit of this room changes"""
+        if self._is_builder(looker):
+            return super().get_display_exits(looker, **kwargs)
+        return self.appearance.get(
+            'exits', self.appearance.exits_version,
+            lambda: (super(Room, self).get_display_exits(looker, **kwargs),
+                     is_public(self.exits)))
+
+    def get_display_things(self, looker, **kwargs):
+        """Object list, cached until the contents change"""
+        if self._is_builder(looker):
+            return super().get_display_things(looker, **kwargs)
+        return self.appearance.get(
+            'things', self.appearance.contents_version,
+            lambda: (super(Room, self).get_display_things(looker, **kwargs),
+                     is_public(self.contents_get(content_type="object"))))
+
+
+class WildernessRoom(Room):
+    """
+    A tile of the wilderness grid. Gateways keep their coordinates and
+    description; pooled rooms are lent to whichever tile is occupied and
+    describe its terrain. See `world.wilderness`.
+    """
+
+    @lazy_property
+    def exit_index(self):
+        """Real exits, then virtual exits to the neighbouring tiles"""
+        return WildernessExits(self)
+
+    @property
+    def coordinates(self):
+        """The (x, y) of the tile, or None for a spare room"""
+        coordinates = self.db.coordinates
+        return tuple(coordinates) if coordinates else None
+
+    def at_object_leave(self, moved_obj, target_location, **kwargs):
+        """Hand the room back to the pool once the move has emptied it"""
+        super().at_object_leave(moved_obj, target_location, **kwargs)
+        delay(0, WILDERNESS.release, self)
+
+    def get_display_desc(self, looker, **kwargs):
+        """Gateway description, or the terrain of the tile"""
+        if self.db.desc or not self.coordinates:
+            return super().get_display_desc(looker, **kwargs)
+        x, y = self.coordinates
+        return f"{WILDERNESS.terrain(self.coordinates).desc}\n\n(Wasteland {x}, {y})"
+
+    def get_display_exits(self, looker, **kwargs):
+        """Real exits, then the directions open into the wilderness"""
+        exits = super().get_display_exits(looker, **kwargs)
+        directions = self.exit_index.directions()
+        if directions:
+            exits = "\n".join(filter(None, [exits, "|wWasteland:|n " + ", ".join(directions)]))
+        return exits
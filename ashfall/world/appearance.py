@@ -0,0 +1,66 @@
+"""
+Room appearance cache for Ashfall MUD
+
+Rendering a room rebuilds its description, exit list and contents list
+on every look. The `AppearanceCache`, available as `room.appearance`,
+keeps the rendered fragments that look the same to every ordinary
+viewer, each tagged with what it was rendered from:
+
+    desc    - the description text
+    exits   - the exits version, bumped when an exit of the room changes
+    things  - the contents version, bumped when an object that is neither
+              a character nor an exit enters, leaves, is renamed or is
+              deleted
+
+Only the header and the list of other characters are rendered per look.
+Builders see dbrefs, so their looks bypass the cache, and fragments
+listing anything with a view lock other than `view:all()` are never
+cached, since they differ per viewer.
+"""
+
+PUBLIC_VIEW_LOCK = "view:all()"
+
+
+def is_public(objects):
+    """Check that every object in objects is visible to everyone"""
+    return all(obj.locks.get("view") in ("", PUBLIC_VIEW_LOCK) for obj in objects)
+
+
+def is_thing(obj):
+    """Check if obj is listed with the things of a room, not the characters or exits"""
+    return "object" in getattr(obj, '_content_types', ())
+
+
+class AppearanceCache:
+    """Rendered appearance fragments of one room"""
+
+    def __init__(self, room):
+        self.room = room
+        self.contents_version = 0
+        self.exits_version = 0
+        # fragment name -> (token, text, cacheable)
+        self.fragments = {}
+
+    def bump_contents(self):
+        """Mark the contents fragment stale"""
+        self.contents_version += 1
+
+    def bump_exits(self):
+        """Mark the exits fragment stale"""
+        self.exits_version += 1
+
+    def get(self, name, token, render):
+        """
+        Get a fragment, rendering it only if token changed.
+
+        Args:
+            name (str): Fragment name.
+            token: Anything the fragment was rendered from, compared by equality.
+            render (callable): Returns (text, cacheable).
+        """
+        cached = self.fragments.get(name)
+        if cached and cached[2] and cached[0] == token:
+            return cached[1]
+        text, cacheable = render()
+        self.fragments[name] = (token, text, cacheable)
+        return text
@@ -0,0 +1,278 @@
+"""
+Character classes for Ashfall MUD
+
+All class data lives in `CLASS_DATA` and `ADVANCED_CLASS_DATA` below. It is
+loaded into immutable records and validated once, when this module is
+first imported, and looked up by name from `CLASSES` and
+`ADVANCED_CLASSES` afterwards. Adding a class means adding an entry here;
+the rules in `world.rules` apply whatever the records say.
+
+Class entries:
+
+    description     - one-line summary shown by the `classes` command
+    bonuses         - ability bonuses applied when the class is chosen
+    hit_points      - extra hit points (and max) when the class is chosen
+    mana            - extra mana (and max) when the class is chosen
+    level_stats     - ability increases on every level up
+    hp_per_level    - base hit points gained per level, before constitution
+    mana_per_level  - base mana gained per level
+    mana_stats      - abilities that add half their value to mana per level;
+                      classes without any gain no mana on level up
+    skills          - skill -> starting proficiency, by id in
+                      `world.skills.SKILLS`
+    spells          - spells granted, by key in `world.spells.SPELLS`
+    advanced        - advanced classes available after enough remorts
+
+Advanced class entries use `bonuses`, `hit_points` and `mana` the same
+way, applied when the advanced class is chosen.
+
+This module has no Evennia dependencies.
+"""
+
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from world.skills import MAX_PROFICIENCY, SKILLS
+from world.spells import SPELLS
+
+ABILITIES = ('strength', 'intelligence', 'wisdom', 'dexterity', 'constitution', 'charisma')
+
+CLASS_DATA = {
+    'warrior': {
+        'description': "Strong fighters with high hit points and combat abilities",
+        'bonuses': {'strength': 2, 'constitution': 1},
+        'hit_points': 20,
+        'level_stats': {'strength': 1, 'constitution': 1},
+        'hp_per_level': 10,
+        'skills': {'sword': 10, 'shield': 10, 'armor': 10},
+        'advanced': ('warlord', 'juggernaut'),
+    },
+    'mage': {
+        'description': "Masters of magic with high intelligence and mana",
+        'bonuses': {'intelligence': 3},
+        'mana': 50,
+        'level_stats': {'intelligence': 2},
+        'hp_per_level': 4,
+        'mana_per_level': 10,
+        'mana_stats': ('intelligence',),
+        'spells': ('fireball', 'magic_missile', 'light'),
+        'advanced': ('warlock', 'arcanist'),
+    },
+    'cleric': {
+        'description': "Divine spellcasters with wisdom and healing abilities",
+        'bonuses': {'wisdom': 3},
+        'hit_points': 10,
+        'mana': 30,
+        'level_stats': {'wisdom': 2},
+        'hp_per_level': 6,
+        'mana_per_level': 8,
+        'mana_stats': ('wisdom',),
+        'spells': ('heal', 'cure_light', 'bless'),
+        'advanced': ('inquisitor', 'hierophant'),
+    },
+    'thief': {
+        'description': "Agile rogues with high dexterity and stealth",
+        'bonuses': {'dexterity': 3},
+        'hit_points': 10,
+        'level_stats': {'dexterity': 2},
+        'hp_per_level': 6,
+        'skills': {'stealth': 15, 'lockpick': 10, 'sneak': 15},
+        'advanced': ('assassin', 'ashstalker'),
+    },
+    'psionicist': {
+        'description': "Mentalists with psychic powers and balanced stats",
+        'bonuses': {'intelligence': 2, 'wisdom': 2},
+        'hit_points': 10,
+        'mana': 40,
+        'level_stats': {'intelligence': 1, 'wisdom': 1},
+        'hp_per_level': 6,
+        'mana_per_level': 6,
+        'mana_stats': ('intelligence', 'wisdom'),
+        'spells': ('mind_blast', 'telekinesis', 'mind_scan'),
+        'advanced': ('mindreaver', 'seer'),
+    },
+}
+
+ADVANCED_CLASS_DATA = {
+    'warlord': {
+        'bonuses': {'strength': 3, 'charisma': 2},
+        'hit_points': 50,
+    },
+    'juggernaut': {
+        'bonuses': {'strength': 2, 'constitution': 3},
+        'hit_points': 100,
+    },
+    'warlock': {
+        'bonuses': {'intelligence': 3, 'charisma': 2},
+        'mana': 100,
+    },
+    'arcanist': {
+        'bonuses': {'intelligence': 4},
+        'mana': 150,
+    },
+    'inquisitor': {
+        'bonuses': {'wisdom': 3, 'strength': 2},
+        'hit_points': 30,
+        'mana': 50,
+    },
+    'hierophant': {
+        'bonuses': {'wisdom': 4},
+        'mana': 100,
+    },
+    'assassin': {
+        'bonuses': {'dexterity': 3, 'strength': 2},
+        'hit_points': 20,
+    },
+    'ashstalker': {
+        'bonuses': {'dexterity': 4, 'wisdom': 2},
+        'hit_points': 30,
+    },
+    'mindreaver': {
+        'bonuses': {'intelligence': 3, 'wisdom': 3},
+        'mana': 80,
+    },
+    'seer': {
+        'bonuses': {'wisdom': 4, 'intelligence': 2},
+        'mana': 120,
+    },
+}
+
+
+@dataclass(frozen=True)
+class AdvancedClass:
+    """An advanced class, chosen after enough remorts"""
+
+    key: str
+    base_class: str
+    bonuses: MappingProxyType
+    hit_points: int
+    mana: int
+    # (stat, delta) pairs applied in one pass when the class is chosen
+    deltas: tuple
+
+
+@dataclass(frozen=True)
+class CharacterClass:
+    """A starting class"""
+
+    key: str
+    description: str
+    bonuses: MappingProxyType
+    hit_points: int
+    mana: int
+    level_stats: tuple
+    hp_per_level: int
+    mana_per_level: int
+    mana_stats: tuple
+    skills: MappingProxyType
+    spells: tuple
+    advanced: tuple
+    deltas: tuple
+
+
+def _vital_deltas(bonuses, hit_points, mana):
+    """Flatten ability bonuses and vitals into (stat, delta) pairs"""
+    deltas = list(bonuses.items())
+    if hit_points:
+        deltas += [('hit_points', hit_points), ('max_hit_points', hit_points)]
+    if mana:
+        deltas += [('mana', mana), ('max_mana', mana)]
+    return tuple(deltas)
+
+
+def _check_abilities(name, stats):
+    unknown = set(stats) - set(ABILITIES)
+    if unknown:
+        raise ValueError(f"Class '{name}' uses unknown abilities: {', '.join(sorted(unknown))}")
+
+
+def load_classes(class_data, advanced_data):
+    """
+    Build and validate the class registries.
+
+    Returns:
+        tuple: (classes, advanced_classes), read-only mappings of name to
+            `CharacterClass` and `AdvancedClass`.
+
+    Raises:
+        ValueError: If the data is inconsistent.
+    """
+    owners = {}
+    classes = {}
+    for key, data in class_data.items():
+        for field in ('bonuses', 'level_stats'):
+            _check_abilities(key, data.get(field, {}))
+        _check_abilities(key, data.get('mana_stats', ()))
+        for skill, proficiency in data.get('skills', {}).items():
+            if skill not in SKILLS:
+                raise ValueError(f"Class '{key}' grants unknown skill '{skill}'.")
+            if not 0 < proficiency <= MAX_PROFICIENCY:
+                raise ValueError(f"Class '{key}' grants skill '{skill}' at invalid "
+                                 f"proficiency {proficiency}.")
+        for spell in data.get('spells', ()):
+            if spell not in SPELLS:
+                raise ValueError(f"Class '{key}' grants unknown spell '{spell}'.")
+        for advanced in data.get('advanced', ()):
+            if advanced not in advanced_data:
+                raise ValueError(f"Class '{key}' lists unknown advanced class '{advanced}'.")
+            if advanced in owners:
+                raise ValueError(f"Advanced class '{advanced}' belongs to both "
+                                 f"'{owners[advanced]}' and '{key}'.")
+            owners[advanced] = key
+        bonuses = MappingProxyType(dict(data.get('bonuses', {})))
+        hit_points = data.get('hit_points', 0)
+        mana = data.get('mana', 0)
+        classes[key] = CharacterClass(
+            key=key,
+            description=data['description'],
+            bonuses=bonuses,
+            hit_points=hit_points,
+            mana=mana,
+            level_stats=tuple(data.get('level_stats', {}).items()),
+            hp_per_level=data['hp_per_level'],
+            mana_per_level=data.get('mana_per_level', 0),
+            mana_stats=tuple(data.get('mana_stats', ())),
+            skills=MappingProxyType(dict(data.get('skills', {}))),
+            spells=tuple(data.get('spells', ())),
+            advanced=tuple(data.get('advanced', ())),
+            deltas=_vital_deltas(bonuses, hit_points, mana),
+        )
+
+    advanced_classes = {}
+    for key, data in advanced_data.items():
+        if key not in owners:
+            raise ValueError(f"Advanced class '{key}' is not offered by any class.")
+        if key in classes:
+            raise ValueError(f"'{key}' is both a class and an advanced class.")
+        _check_abilities(key, data.get('bonuses', {}))
+        bonuses = MappingProxyType(dict(data.get('bonuses', {})))
+        hit_points = data.get('hit_points', 0)
+        mana = data.get('mana', 0)
+        advanced_classes[key] = AdvancedClass(
+            key=key,
+            base_class=owners[key],
+            bonuses=bonuses,
+            hit_points=hit_points,
+            mana=mana,
+            deltas=_vital_deltas(bonuses, hit_points, mana),
+        )
+    return MappingProxyType(classes), MappingProxyType(advanced_classes)
+
+
+CLASSES, ADVANCED_CLASSES = load_classes(CLASS_DATA, ADVANCED_CLASS_DATA)
+
+
+def get_class(name):
+    """Get the `CharacterClass` called name, or None"""
+    return CLASSES.get(name)
+
+
+def get_advanced_class(name):
+    """Get the `AdvancedClass` called name, or None"""
+    return ADVANCED_CLASSES.get(name)
+
+
+def apply_deltas(record, deltas):
+    """Add every (stat, delta) pair to record"""
+    for stat, delta in deltas:
+        setattr(record, stat, (getattr(record, stat) or 0) + delta)
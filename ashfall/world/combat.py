@@ -0,0 +1,164 @@
+"""
+Combat engine for Ashfall MUD
+
+Every active fight is kept in one in-memory registry and all of them are
+resolved together once per combat round, driven by a single ticker
+subscription instead of one per fighter. Hit checks and damage for the
+whole round are computed in one batch (see `world.rules`). The
+per-character side of a fight lives in the `CombatHandler`, available as
+`character.combat`.
+"""
+
+from django.conf import settings
+from evennia.utils import logger
+
+from world import rules
+from world.ticker import TickerService
+
+
+class CombatEngine(TickerService):
+    """
+    Registry of active fights, resolved in one pass per round.
+
+    Fights are stored as attacker -> target. The ticker is only subscribed
+    while at least one fight is active.
+    """
+
+    idstring = "combat_round"
+
+    def __init__(self):
+        super().__init__()
+        self.fights = {}
+
+    def get_interval(self):
+        """Get the combat round length in seconds"""
+        return getattr(settings, 'COMBAT_TIMEOUT', 30)
+
+    def get_callback(self):
+        return combat_round
+
+    def has_work(self):
+        return bool(self.fights)
+
+    def add(self, attacker, target):
+        """Register a fight"""
+        self.fights[attacker] = target
+        self.update_ticker()
+
+    def remove(self, combatant, opponent):
+        """Remove the fights between combatant and opponent, in both directions"""
+        for attacker, target in ((combatant, opponent), (opponent, combatant)):
+            if self.fights.get(attacker) is target:
+                del self.fights[attacker]
+        self.update_ticker()
+
+    def is_fighting(self, combatant):
+        """Check if combatant is an attacker in an active fight"""
+        return combatant in self.fights
+
+    def resolve_round(self):
+        """
+        Resolve one round of every active fight.
+
+        The stats of every attacker are gathered first and all hit checks
+        and damage rolls are computed in one batch by `rules.resolve_attacks`
+        before the results are applied in order.
+        """
+        attacks = []
+        columns = ([], [], [], [], [])
+        for attacker, target in list(self.fights.items()):
+            if not target.combat.in_combat:
+                attacker.combat.end()
+                continue
+            try:
+                hit_bonus, damage_dice, damage_bonus, strength = attacker.get_attack_stats()
+                armor_class = target.get_armor_class()
+            except Exception:
+                logger.log_trace(f"Combat round failed for {attacker}.")
+                attacker.combat.end()
+                continue
+            attacks.append((attacker, target))
+            for column, value in zip(columns, (hit_bonus, armor_class, damage_dice,
+                                               damage_bonus, strength)):
+                column.append(value)
+
+        for (attacker, target), damage in zip(attacks, rules.resolve_attacks(*columns)):
+            # fights can end while earlier attacks in this round are applied
+            if self.fights.get(attacker) is not target:
+                continue
+            try:
+                attacker.deliver_attack(target, damage)
+            except Exception:
+                logger.log_trace(f"Combat round failed for {attacker}.")
+                attacker.combat.end()
+
+        self.update_ticker()
+
+
+COMBAT_ENGINE = CombatEngine()
+
+
+class CombatHandler:
+    """
+    Transient combat state of one character, kept in ndb.
+
+    Nothing here is persisted. Fights only exist in the in-memory
+    COMBAT_ENGINE and end on a reload, so there is no combat state that
+    needs to survive one.
+    """
+
+    legacy_attributes = ('is_combat', 'combat_target', 'combat_weapon')
+
+    def __init__(self, obj):
+        self.obj = obj
+        # combat state used to be stored as Attributes; drop stale copies
+        for attr in self.legacy_attributes:
+            if obj.attributes.has(attr):
+                obj.attributes.remove(attr)
+
+    @property
+    def in_combat(self):
+        """True if the character is fighting someone"""
+        return self.obj.ndb.combat_target is not None
+
+    @property
+    def target(self):
+        """The character being fought, if any"""
+        return self.obj.ndb.combat_target
+
+    @property
+    def weapon(self):
+        """The weapon named when the fight was started, if any"""
+        return self.obj.ndb.combat_weapon
+
+    def start(self, target, weapon=None):
+        """
+        Start fighting target and register the fight with the engine. A
+        target that is already fighting someone else keeps that fight.
+        """
+        self._set(target, weapon)
+        if not target.combat.in_combat:
+            target.combat._set(self.obj)
+        COMBAT_ENGINE.add(self.obj, target)
+
+    def end(self):
+        """
+        End the fight with the current target. The target only leaves
+        combat if it was fighting this character; others still attacking
+        it keep their fights.
+        """
+        target = self.target
+        self._set(None)
+        if target:
+            COMBAT_ENGINE.remove(self.obj, target)
+            if target.combat.target is self.obj:
+                target.combat._set(None)
+
+    def _set(self, target, weapon=None):
+        self.obj.ndb.combat_target = target
+        self.obj.ndb.combat_weapon = weapon
+
+
+def combat_round():
+    """Ticker callback resolving the current round of all fights"""
+    COMBAT_ENGINE.resolve_round()
@@ -0,0 +1,161 @@
+"""
+Dice expressions for Ashfall MUD
+
+Expressions are parsed once into a compiled `DiceExpression` and cached by
+their string, so hot combat code only pays for the roll itself.
+
+Supported syntax, with terms joined by `+` or `-`:
+
+    2d8         roll two eight-sided dice
+    d20         same as 1d20
+    4d6kh3      roll four six-sided dice, keep the highest three
+    2d20kl1     roll two twenty-sided dice, keep the lowest one
+    3d6!        exploding dice; every die showing its maximum is rolled again
+    5           a flat modifier
+
+so `2d8+3`, `1d6!+1d4-1` and `4d6kh3` are all valid.
+
+This module has no Evennia dependencies.
+"""
+
+import random
+import re
+from functools import lru_cache
+
+_TERM_RE = re.compile(r"\s*([+-]?)\s*(?:(\d*)d(\d+)(!?)(?:k([hl])(\d+))?|(\d+))\s*",
+                      re.IGNORECASE)
+
+# upper bound on re-rolls of a single exploding die
+MAX_EXPLOSIONS = 20
+
+
+class DiceExpression:
+    """
+    A compiled dice expression.
+
+    Dice terms are stored as tuples of (sign, count, sides, explode, keep)
+    where keep is None, ('h', n) or ('l', n). Flat terms are folded into
+    `modifier`.
+    """
+
+    __slots__ = ('expression', 'terms', 'modifier', 'simple_terms')
+
+    def __init__(self, expression, terms, modifier):
+        self.expression = expression
+        self.terms = terms
+        self.modifier = modifier
+        # plain NdM terms can be rolled without the generic term loop
+        self.simple_terms = None
+        if all(sign > 0 and not explode and keep is None
+               for sign, _, _, explode, keep in terms):
+            self.simple_terms = tuple((count, sides) for _, count, sides, _, _ in terms)
+
+    def __repr__(self):
+        return f"<DiceExpression {self.expression}>"
+
+    @property
+    def minimum(self):
+        """Lowest possible result"""
+        total = self.modifier
+        for sign, count, sides, _, keep in self.terms:
+            kept = keep[1] if keep else count
+            total += sign * kept * (1 if sign > 0 else sides)
+        return total
+
+    @property
+    def maximum(self):
+        """Highest possible result, ignoring explosions"""
+        total = self.modifier
+        for sign, count, sides, _, keep in self.terms:
+            kept = keep[1] if keep else count
+            total += sign * kept * (sides if sign > 0 else 1)
+        return total
+
+    def roll(self, rng=random):
+        """Roll the expression and return the total"""
+        rand = rng.random
+        total = self.modifier
+        if self.simple_terms is not None:
+            for count, sides in self.simple_terms:
+                for _ in range(count):
+                    total += int(rand() * sides) + 1
+            return total
+        for sign, count, sides, explode, keep in self.terms:
+            rolls = []
+            for _ in range(count):
+                value = die = int(rand() * sides) + 1
+                if explode:
+                    explosions = 0
+                    while die == sides and explosions < MAX_EXPLOSIONS:
+                        die = int(rand() * sides) + 1
+                        value += die
+                        explosions += 1
+                rolls.append(value)
+            if keep:
+                rolls.sort(reverse=keep[0] == 'h')
+                rolls = rolls[:keep[1]]
+            total += sign * sum(rolls)
+        return total
+
+
+@lru_cache(maxsize=1024)
+def compile_dice(expression):
+    """
+    Parse a dice expression into a cached `DiceExpression`.
+
+    Raises:
+        ValueError: If the expression is not valid dice syntax.
+    """
+    text = expression.strip()
+    if not text:
+        raise ValueError("Empty dice expression.")
+    terms = []
+    modifier = 0
+    pos = 0
+    while pos < len(text):
+        match = _TERM_RE.match(text, pos)
+        if not match or (pos and not match.group(1)):
+            raise ValueError(f"Invalid dice expression '{expression}'.")
+        sign_str, count, sides, explode, keep_mode, keep_count, flat = match.groups()
+        sign = -1 if sign_str == '-' else 1
+        if flat is not None:
+            modifier += sign * int(flat)
+        else:
+            count = int(count) if count else 1
+            sides = int(sides)
+            if count < 1 or sides < 1:
+                raise ValueError(f"Invalid dice term in '{expression}'.")
+            if explode and sides < 2:
+                raise ValueError(f"A d{sides} cannot explode in '{expression}'.")
+            keep = None
+            if keep_mode:
+                keep = (keep_mode.lower(), min(int(keep_count), count))
+            terms.append((sign, count, sides, bool(explode), keep))
+        pos = match.end()
+    return DiceExpression(expression, tuple(terms), modifier)
+
+
+def roll(expression, rng=random):
+    """Roll a dice expression string"""
+    return compile_dice(expression).roll(rng)
+
+
+def roll_many(expressions, rng=random):
+    """
+    Roll several dice expressions in one call.
+
+    Args:
+        expressions (iterable): Expression strings or compiled
+            `DiceExpression`s, freely mixed.
+        rng (Random, optional): Source of randomness.
+
+    Returns:
+        list: The rolled totals, in the same order.
+    """
+    results = []
+    append = results.append
+    for expression in expressions:
+        if not isinstance(expression, DiceExpression):
+            expression = compile_dice(expression)
+        append(expression.roll(rng))
+    return results
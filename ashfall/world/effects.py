@@ -0,0 +1,208 @@
+"""
+Timed effects for Ashfall MUD
+
+Buffs and debuffs are `Effect` records in the `EFFECTS` catalog. A
+character's active effects are managed by its `EffectHandler`, available
+as `character.effects`, which keeps the summed stat modifiers of all
+active effects cached for combat to read.
+
+Effects never change a character's base stats; they only contribute
+modifiers, so expiry just drops them and recomputes the cache.
+
+Expiry for every character is scheduled in one global heap, the
+`EFFECT_SCHEDULER`, which keeps a single reactor timer armed for the
+earliest expiry, no matter how many effects are active.
+
+Stacking rules:
+
+    refresh - re-applying resets the duration
+    stack   - re-applying adds a stack, up to max_stacks, and resets the
+              duration; modifiers are multiplied by the stack count
+    ignore  - re-applying while active does nothing
+"""
+
+import heapq
+import itertools
+import time
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Optional
+
+STACKING = ('refresh', 'stack', 'ignore')
+
+
+@dataclass(frozen=True)
+class Effect:
+    """A timed buff or debuff"""
+
+    key: str
+    duration: float
+    modifiers: MappingProxyType = field(default_factory=lambda: MappingProxyType({}))
+    stacking: str = 'refresh'
+    max_stacks: int = 1
+    expire_msg: Optional[str] = None
+
+
+def _load_effects(*effects):
+    catalog = {}
+    for effect in effects:
+        if effect.key in catalog:
+            raise ValueError(f"Effect '{effect.key}' is defined twice.")
+        if effect.stacking not in STACKING:
+            raise ValueError(f"Effect '{effect.key}' has unknown stacking '{effect.stacking}'.")
+        if effect.duration <= 0 or effect.max_stacks < 1:
+            raise ValueError(f"Effect '{effect.key}' needs a positive duration and max_stacks.")
+        catalog[effect.key] = effect
+    return MappingProxyType(catalog)
+
+
+EFFECTS = _load_effects(
+    Effect('bless', duration=120, modifiers=MappingProxyType({'hit_bonus': 2}),
+           stacking='refresh', expire_msg="The blessing fades."),
+)
+
+
+class EffectScheduler:
+    """
+    Global expiry heap for the effects of all characters.
+
+    Entries are (expires_at, sequence, obj, effect_key). Refreshing an
+    effect pushes a new entry and leaves the old one to be skipped when it
+    comes due, so the heap never has to be searched.
+    """
+
+    def __init__(self):
+        self.heap = []
+        self.counter = itertools.count()
+        self.timer = None
+        self.timer_at = None
+
+    def schedule(self, obj, key, expires_at):
+        """Schedule expiry of obj's effect key at the given time"""
+        heapq.heappush(self.heap, (expires_at, next(self.counter), obj, key))
+        if self.timer_at is None or expires_at < self.timer_at:
+            self._arm()
+
+    def run(self):
+        """Expire every effect that is due, grouped per character"""
+        self.timer = None
+        self.timer_at = None
+        now = time.time()
+        due = {}
+        while self.heap and self.heap[0][0] <= now:
+            _, _, obj, key = heapq.heappop(self.heap)
+            due.setdefault(obj, []).append(key)
+        for obj, keys in due.items():
+            if not obj.pk:
+                continue
+            try:
+                obj.effects.expire(keys, now)
+            except Exception:
+                from evennia.utils import logger
+                logger.log_trace(f"Expiring effects on {obj} failed.")
+        self._arm()
+
+    def _arm(self):
+        """Point the single timer at the earliest pending expiry"""
+        from twisted.internet import reactor
+        if self.timer is not None and self.timer.active():
+            self.timer.cancel()
+        self.timer = None
+        self.timer_at = None
+        if self.heap:
+            self.timer_at = self.heap[0][0]
+            self.timer = reactor.callLater(max(0, self.timer_at - time.time()), self.run)
+
+
+EFFECT_SCHEDULER = EffectScheduler()
+
+
+class EffectHandler:
+    """
+    Active effects of one character.
+
+    Active effects are persisted in `db.effects` as
+    {effect_key: [expires_at, stacks]}, written once per change. Effects
+    that expired while the server was down are dropped on load.
+    """
+
+    def __init__(self, obj):
+        self.obj = obj
+        self.active = {}
+        self.modifiers = {}
+        now = time.time()
+        stored = obj.attributes.get('effects', default=None) or {}
+        for key, (expires_at, stacks) in stored.items():
+            if key in EFFECTS and expires_at > now:
+                self.active[key] = [expires_at, stacks]
+                EFFECT_SCHEDULER.schedule(obj, key, expires_at)
+        if len(self.active) != len(stored):
+            self._save()
+        self._recompute()
+
+    def has(self, key):
+        """Check if effect key is active"""
+        return key in self.active
+
+    def get_modifier(self, stat):
+        """Get the summed modifier of all active effects for stat"""
+        return self.modifiers.get(stat, 0)
+
+    def remaining(self, key):
+        """Seconds left on effect key, 0 if inactive"""
+        if key not in self.active:
+            return 0
+        return max(0, self.active[key][0] - time.time())
+
+    def add(self, key):
+        """
+        Apply effect key, following its stacking rule.
+
+        Returns:
+            bool: False if the effect was ignored because it was already active.
+        """
+        effect = EFFECTS[key]
+        current = self.active.get(key)
+        if current and effect.stacking == 'ignore':
+            return False
+        stacks = 1
+        if current and effect.stacking == 'stack':
+            stacks = min(current[1] + 1, effect.max_stacks)
+        expires_at = time.time() + effect.duration
+        self.active[key] = [expires_at, stacks]
+        EFFECT_SCHEDULER.schedule(self.obj, key, expires_at)
+        self._changed()
+        return True
+
+    def remove(self, key):
+        """Remove effect key immediately"""
+        if self.active.pop(key, None):
+            self._changed()
+
+    def expire(self, keys, now):
+        """Drop the given effects if they are due, in one update"""
+        expired = [key for key in dict.fromkeys(keys)
+                   if key in self.active and self.active[key][0] <= now]
+        if not expired:
+            return
+        for key in expired:
+            del self.active[key]
+        self._changed()
+        messages = [EFFECTS[key].expire_msg for key in expired if EFFECTS[key].expire_msg]
+        if messages:
+            self.obj.msg("\n".join(messages))
+
+    def _changed(self):
+        self._save()
+        self._recompute()
+        self.obj.derived.invalidate()
+
+    def _save(self):
+        self.obj.db.effects = {key: list(value) for key, value in self.active.items()}
+
+    def _recompute(self):
+        modifiers = {}
+        for key, (_, stacks) in self.active.items():
+            for stat, delta in EFFECTS[key].modifiers.items():
+                modifiers[stat] = modifiers.get(stat, 0) + delta * stacks
+        self.modifiers = modifiers
@@ -0,0 +1,134 @@
+"""
+Equipment for Ashfall MUD
+
+What a character has equipped is managed by its `EquipmentHandler`,
+available as `character.equipment`. Only filled slots are persisted, as
+one `equipped` Attribute mapping slot -> object id; the objects are
+resolved in one query the first time they are needed and then served
+from memory, so looking up the wielded weapon on every swing costs
+nothing.
+
+Equipping or unequipping marks the character's derived stats dirty.
+"""
+
+SLOTS = ('head', 'neck', 'body', 'about', 'arms', 'hands', 'finger_l', 'finger_r',
+         'wield', 'shield', 'legs', 'feet')
+ATTRIBUTE = 'equipped'
+
+
+class EquipmentHandler:
+    """Equipped items of one character"""
+
+    def __init__(self, obj):
+        self.obj = obj
+        self._items = None
+        stored = obj.attributes.get(ATTRIBUTE, default=None)
+        if stored is None:
+            self._migrate()
+        else:
+            self.ids = dict(stored)
+
+    def _migrate(self):
+        """Convert the legacy `equipment` Attribute of slot -> object"""
+        legacy = self.obj.attributes.get('equipment', default=None) or {}
+        self._items = {slot: item for slot, item in legacy.items() if item and slot in SLOTS}
+        self.ids = {slot: item.id for slot, item in self._items.items()}
+        if legacy:
+            self.obj.attributes.remove('equipment')
+            self._save()
+
+    def _resolve(self):
+        """Load every equipped object in one query"""
+        from evennia.objects.models import ObjectDB
+        objects = {obj.id: obj for obj in ObjectDB.objects.filter(id__in=self.ids.values())}
+        self._items = {slot: objects[dbid] for slot, dbid in self.ids.items() if dbid in objects}
+        if len(self._items) != len(self.ids):
+            self.ids = {slot: item.id for slot, item in self._items.items()}
+            self._save()
+
+    def _save(self):
+        self.obj.attributes.add(ATTRIBUTE, dict(self.ids))
+
+    @property
+    def items(self):
+        """Slot -> equipped item, for filled slots only"""
+        if self._items is None:
+            self._resolve()
+        # items given away or dropped are no longer equipped
+        lost = [slot for slot, item in self._items.items() if item.location != self.obj]
+        if lost:
+            for slot in lost:
+                del self._items[slot]
+                del self.ids[slot]
+            self._changed()
+        return self._items
+
+    def get(self, slot):
+        """Get the item in slot, or None"""
+        return self.items.get(slot)
+
+    @property
+    def weapon(self):
+        """The wielded weapon, or None"""
+        return self.get('wield')
+
+    def slot_of(self, item):
+        """Get the slot item is equipped in, or None"""
+        for slot, equipped in self.items.items():
+            if equipped == item:
+                return slot
+        return None
+
+    def find(self, name):
+        """
+        Find an equipped item by name, ignoring case.
+
+        Returns:
+            tuple: (slot, item), or (None, None) if nothing matches.
+        """
+        name = name.lower()
+        for slot, item in self.items.items():
+            if item.key.lower() == name:
+                return slot, item
+        return None, None
+
+    def get_bonus(self, attribute, exclude=('wield',)):
+        """Sum an Attribute, such as armor_bonus, over the equipped items"""
+        return sum(item.attributes.get(attribute, default=0) or 0
+                   for slot, item in self.items.items() if slot not in exclude)
+
+    def equip(self, item, slot):
+        """
+        Put item in slot.
+
+        Returns:
+            The item previously in slot, or None.
+
+        Raises:
+            ValueError: If slot is not an equipment slot.
+        """
+        if slot not in SLOTS:
+            raise ValueError(f"Unknown equipment slot '{slot}'.")
+        previous = self.items.get(slot)
+        if previous == item:
+            return None
+        self._items[slot] = item
+        self.ids[slot] = item.id
+        self._changed()
+        return previous
+
+    def unequip(self, slot):
+        """
+        Empty slot.
+
+        Returns:
+            The item that was in slot, or None.
+        """
+        item = self.items.pop(slot, None)
+        if self.ids.pop(slot, None) is not None:
+            self._changed()
+        return item
+
+    def _changed(self):
+        self._save()
+        self.obj.derived.invalidate()
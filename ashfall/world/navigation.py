@@ -0,0 +1,239 @@
+"""
+Navigation for Ashfall MUD
+
+Direction names, their aliases and reverses are defined once in
+`DIRECTIONS`. Every room keeps an `ExitIndex`, available as
+`room.exit_index`, mapping exit keys, exit aliases and, for exits named
+after a direction, every alias of that direction (`n` -> the `north`
+exit) to the exit object. It is built on first use and invalidated by
+the exit hooks in `typeclasses.exits` when an exit is created, moved,
+renamed or deleted. Exits are stored as objects, so re-targeting an
+exit is seen immediately.
+
+The `ROOM_GRAPH` holds the adjacency of all rooms by object id, loaded
+at server start and updated by the same exit hooks, and answers
+shortest-route queries from cache for the `travel` command. Routes are
+walked by direction through the exit indexes.
+"""
+
+import re
+from collections import deque
+from contextlib import contextmanager
+
+# canonical direction -> (aliases, reverse direction)
+DIRECTIONS = {
+    'north': (('n',), 'south'),
+    'south': (('s',), 'north'),
+    'east': (('e',), 'west'),
+    'west': (('w',), 'east'),
+    'northeast': (('ne',), 'southwest'),
+    'northwest': (('nw',), 'southeast'),
+    'southeast': (('se',), 'northwest'),
+    'southwest': (('sw',), 'northeast'),
+    'up': (('u',), 'down'),
+    'down': (('d',), 'up'),
+}
+
+# any direction name or alias -> canonical direction
+DIRECTION_NAMES = {name: direction
+                   for direction, (aliases, _) in DIRECTIONS.items()
+                   for name in (direction,) + aliases}
+
+
+def normalize_direction(name):
+    """Get the canonical direction for name, or None if it is not one"""
+    return DIRECTION_NAMES.get(name.strip().lower())
+
+
+def reverse_direction(name):
+    """Get the opposite of a direction name, or None"""
+    direction = normalize_direction(name)
+    return DIRECTIONS[direction][1] if direction else None
+
+
+class ExitIndex:
+    """Name -> exit lookup for one room"""
+
+    def __init__(self, room):
+        self.room = room
+        self._index = None
+
+    def _build(self):
+        index = {}
+        for exit in self.room.exits:
+            names = [exit.key] + list(exit.aliases.all())
+            direction = normalize_direction(exit.key)
+            if direction:
+                names += [direction, *DIRECTIONS[direction][0]]
+            for name in names:
+                # the first exit claiming a name keeps it
+                index.setdefault(name.lower(), exit)
+        self._index = index
+
+    def get(self, name):
+        """Get the exit called name, by key, alias or direction alias"""
+        if self._index is None:
+            self._build()
+        name = name.strip().lower()
+        exit = self._index.get(name)
+        if exit is None:
+            direction = DIRECTION_NAMES.get(name)
+            exit = self._index.get(direction) if direction else None
+        return exit
+
+    def invalidate(self):
+        """Drop the index; it is rebuilt on the next lookup"""
+        self._index = None
+
+
+def invalidate_exits(room):
+    """Invalidate the exit index and rendered exit list of room, if it has them"""
+    if not room:
+        return
+    index = getattr(room, 'exit_index', None)
+    if index is not None:
+        index.invalidate()
+    appearance = getattr(room, 'appearance', None)
+    if appearance is not None:
+        appearance.bump_exits()
+
+
+def exit_direction(key):
+    """Get the name an exit is walked by: its direction, or its key"""
+    return normalize_direction(key) or key.strip().lower()
+
+
+class RoomGraph:
+    """
+    Adjacency of every room, by object id, for path queries.
+
+    Loaded from the exits in one query and kept current by the exit hooks.
+    Found paths are cached until the graph changes.
+    """
+
+    max_cached_paths = 1024
+
+    def __init__(self):
+        # exit id -> (room id, destination id, direction)
+        self.exits = None
+        # room id -> {direction: destination id}
+        self.adjacency = {}
+        self.paths = {}
+
+    def load(self):
+        """Build the graph from every exit in the database"""
+        from evennia.objects.models import ObjectDB
+        rows = ObjectDB.objects.filter(db_location__isnull=False,
+                                       db_destination__isnull=False).values_list(
+            'id', 'db_location_id', 'db_destination_id', 'db_key')
+        self.exits = {dbid: (room, destination, exit_direction(key))
+                      for dbid, room, destination, key in rows}
+        self._rebuild()
+
+    def _rebuild(self):
+        adjacency = {}
+        for room, destination, direction in self.exits.values():
+            adjacency.setdefault(room, {}).setdefault(direction, destination)
+        self.adjacency = adjacency
+        self.paths = {}
+
+    @contextmanager
+    def batch(self):
+        """Ignore exit updates while creating many exits, then reload once"""
+        self.exits = None
+        try:
+            yield self
+        finally:
+            self.load()
+
+    def update_exit(self, exit):
+        """Add, change or remove exit after it moved, was renamed or re-targeted"""
+        if self.exits is None:
+            return
+        self.exits.pop(exit.id, None)
+        if exit.pk and exit.location and exit.destination:
+            self.exits[exit.id] = (exit.location.id, exit.destination.id,
+                                   exit_direction(exit.key))
+        self._rebuild()
+
+    def remove_exit(self, exit):
+        """Remove a deleted exit"""
+        if self.exits is not None and self.exits.pop(exit.id, None):
+            self._rebuild()
+
+    def find_path(self, start, goal):
+        """
+        Find a shortest route between two rooms, breadth first.
+
+        Args:
+            start (int): Object id of the room to start in.
+            goal (int): Object id of the room to reach.
+
+        Returns:
+            list: Directions to walk, empty if start is goal, or None if
+                goal can't be reached.
+        """
+        if self.exits is None:
+            self.load()
+        key = (start, goal)
+        if key in self.paths:
+            return self.paths[key]
+
+        previous = {start: None}
+        frontier = deque([start])
+        while frontier and goal not in previous:
+            room = frontier.popleft()
+            for direction, destination in self.adjacency.get(room, {}).items():
+                if destination not in previous:
+                    previous[destination] = (room, direction)
+                    frontier.append(destination)
+
+        path = None
+        if goal in previous:
+            path = []
+            room = goal
+            while previous[room]:
+                room, direction = previous[room]
+                path.append(direction)
+            path.reverse()
+
+        if len(self.paths) >= self.max_cached_paths:
+            self.paths.clear()
+        self.paths[key] = path
+        return path
+
+
+ROOM_GRAPH = RoomGraph()
+
+# one speedwalk step: optional count, then a direction alias
+_SPEEDWALK_RE = re.compile(r"\s*(\d*)\s*(ne|nw|se|sw|[nsewud])[\s,]*")
+# default for SPEEDWALK_MAX_STEPS
+MAX_SPEEDWALK_STEPS = 50
+
+
+def parse_speedwalk(text, max_steps=MAX_SPEEDWALK_STEPS):
+    """
+    Expand a speedwalk string such as '3w2n' or '2 ne, s'.
+
+    Returns:
+        list: Canonical directions, one per step.
+
+    Raises:
+        ValueError: If text is not a valid speedwalk or is longer than
+            max_steps steps.
+    """
+    text = text.strip().lower()
+    steps = []
+    position = 0
+    while position < len(text):
+        match = _SPEEDWALK_RE.match(text, position)
+        if not match:
+            raise ValueError(f"Can't read the speedwalk at '{text[position:]}'.")
+        count = match.group(1) or "1"
+        # check the length before expanding, so a huge count costs nothing
+        if len(count) > len(str(max_steps)) or len(steps) + int(count) > max_steps:
+            raise ValueError(f"A speedwalk can be at most {max_steps} steps.")
+        count = int(count)
+        steps.extend([DIRECTION_NAMES[match.group(2)]] * count)
+        position = match.end()
+    return steps
@@ -46,45 +46,193 @@ Possible keywords are:
 
 See the `spawn` command and `evennia.prototypes.spawner.spawn` for more info.
 
+Ashfall's items are built from the prototypes below. The keyless ones
+(WEAPON, ARMOR, CONSUMABLE, ...) are only parents, giving the typeclass
+and the Attributes every item of that kind has. Code should spawn these
+through `world.spawner`, which resolves the inheritance once.
+
 """
 
-## example of module-based prototypes using
-## the variable name as `prototype_key` and
-## simple Attributes
-
-# from random import randint
-#
-# GOBLIN = {
-# "key": "goblin grunt",
-# "health": lambda: randint(20,30),
-# "resists": ["cold", "poison"],
-# "attacks": ["fists"],
-# "weaknesses": ["fire", "light"],
-# "tags": = [("greenskin", "monster"), ("humanoid", "monster")]
-# }
-#
-# GOBLIN_WIZARD = {
-# "prototype_parent": "GOBLIN",
-# "key": "goblin wizard",
-# "spells": ["fire ball", "lighting bolt"]
-# }
-#
-# GOBLIN_ARCHER = {
-# "prototype_parent": "GOBLIN",
-# "key": "goblin archer",
-# "attacks": ["short bow"]
-# }
-#
-# This is an example of a prototype without a prototype
-# (nor key) of its own, so it should normally only be
-# used as a mix-in, as in the example of the goblin
-# archwizard below.
-# ARCHWIZARD_MIXIN = {
-# "attacks": ["archwizard staff"],
-# "spells": ["greater fire ball", "greater lighting"]
-# }
-#
-# GOBLIN_ARCHWIZARD = {
-# "key": "goblin archwizard",
-# "prototype_parent" : ("GOBLIN_WIZARD", "ARCHWIZARD_MIXIN")
-# }
+## Weapons
+
+WEAPON = {
+    "typeclass": "typeclasses.items.PostApocWeapon",
+    "prototype_tags": ["weapon"],
+    "damage_dice": "1d6",
+    "damage_bonus": 0,
+    "hit_bonus": 0,
+    "weapon_type": "post_apoc",
+    "durability": 100,
+    "max_durability": 100,
+}
+
+RUSTY_PIPE = {
+    "prototype_parent": "WEAPON",
+    "key": "rusty pipe",
+    "aliases": ["pipe", "weapon"],
+    "desc": "A length of corroded water pipe, heavy enough to crack a skull.",
+    "damage_dice": "1d8",
+    "damage_bonus": 1,
+    "durability": 60,
+    "max_durability": 60,
+}
+
+SCRAP_METAL_CLUB = {
+    "prototype_parent": "WEAPON",
+    "key": "scrap metal club",
+    "aliases": ["club", "weapon"],
+    "desc": "Jagged sheet metal bolted around a wooden haft.",
+    "damage_dice": "1d10",
+    "damage_bonus": 2,
+    "durability": 80,
+    "max_durability": 80,
+}
+
+SALVAGED_RIFLE = {
+    "prototype_parent": "WEAPON",
+    "key": "salvaged rifle",
+    "aliases": ["rifle", "weapon"],
+    "desc": "A hunting rifle pieced back together from the parts of three others.",
+    "damage_dice": "2d8",
+    "damage_bonus": 3,
+    "weapon_type": "ranged",
+    "durability": 70,
+    "max_durability": 70,
+}
+
+LASER_PISTOL = {
+    "prototype_parent": "WEAPON",
+    "key": "laser pistol",
+    "aliases": ["pistol", "laser"],
+    "desc": "A pre-war laser pistol. Its emitter still glows a faint red.",
+    "damage_dice": "1d12",
+    "damage_bonus": 4,
+    "weapon_type": "energy",
+    "durability": 90,
+    "max_durability": 90,
+}
+
+## Armor
+
+ARMOR = {
+    "typeclass": "typeclasses.items.PostApocArmor",
+    "prototype_tags": ["armor"],
+    "armor_bonus": 0,
+    "armor_type": "post_apoc",
+    "equipment_slot": "body",
+    "durability": 100,
+    "max_durability": 100,
+}
+
+LEATHER_DUSTER = {
+    "prototype_parent": "ARMOR",
+    "key": "leather duster",
+    "aliases": ["duster", "coat"],
+    "desc": "A long leather coat, cracked and stained by years of ash.",
+    "armor_bonus": 2,
+    "durability": 50,
+    "max_durability": 50,
+}
+
+SCRAP_METAL_ARMOR = {
+    "prototype_parent": "ARMOR",
+    "key": "scrap metal armor",
+    "aliases": ["scrap armor", "armor"],
+    "desc": "Road signs and car doors hammered into a crude breastplate.",
+    "armor_bonus": 4,
+    "durability": 80,
+    "max_durability": 80,
+}
+
+RADIATION_SUIT = {
+    "prototype_parent": "ARMOR",
+    "key": "radiation suit",
+    "aliases": ["suit", "armor"],
+    "desc": "A yellow pre-war hazard suit, patched with duct tape.",
+    "armor_bonus": 3,
+    "durability": 60,
+    "max_durability": 60,
+    "radiation_protection": 5,
+}
+
+COMBAT_HELMET = {
+    "prototype_parent": "ARMOR",
+    "key": "combat helmet",
+    "aliases": ["helmet", "armor"],
+    "desc": "A dented military helmet with a cracked visor.",
+    "armor_bonus": 1,
+    "equipment_slot": "head",
+    "durability": 70,
+    "max_durability": 70,
+}
+
+## Consumables
+
+CONSUMABLE = {
+    "typeclass": "typeclasses.items.Consumable",
+    "prototype_tags": ["consumable"],
+    "uses": 1,
+    "max_uses": 1,
+}
+
+WATER_CANTEEN = {
+    "prototype_parent": "CONSUMABLE",
+    "key": "water canteen",
+    "aliases": ["canteen", "water"],
+    "desc": "A dented army canteen. The water inside is almost clean.",
+    "uses": 10,
+    "max_uses": 10,
+    "healing": 20,
+}
+
+MEDKIT = {
+    "prototype_parent": "CONSUMABLE",
+    "key": "medical kit",
+    "aliases": ["medkit", "med"],
+    "desc": "A first aid kit with bandages, antiseptic and a few stimpaks.",
+    "uses": 5,
+    "max_uses": 5,
+    "healing": 50,
+}
+
+RAD_AWAY = {
+    "prototype_parent": "CONSUMABLE",
+    "key": "rad-away",
+    "aliases": ["medicine", "rad"],
+    "desc": "An IV bag of orange fluid that flushes radiation from the body.",
+    "uses": 3,
+    "max_uses": 3,
+    "radiation_healing": 30,
+}
+
+## Currency and ammunition
+
+BOTTLE_CAP = {
+    "typeclass": "typeclasses.items.Caps",
+    "prototype_tags": ["currency"],
+    "key": "bottle cap",
+    "aliases": ["cap"],
+    "desc": "A bent bottle cap, the currency of the wasteland.",
+    "value": 1,
+}
+
+AMMO = {
+    "typeclass": "typeclasses.items.Ammo",
+    "prototype_tags": ["ammo"],
+    "key": "box of ammo",
+    "aliases": ["ammo", "box"],
+    "desc": "A cardboard box of mismatched cartridges.",
+    "ammo_type": "standard",
+    "quantity": 10,
+    "max_quantity": 10,
+}
+
+ENERGY_CELL = {
+    "prototype_parent": "AMMO",
+    "key": "energy cell",
+    "aliases": ["cell", "battery"],
+    "desc": "A small fusion cell for energy weapons. Its charge light blinks green.",
+    "ammo_type": "energy",
+    "quantity": 5,
+    "max_quantity": 5,
+}
@@ -0,0 +1,92 @@
+"""
+Regeneration service for Ashfall MUD
+
+Characters with a vital below its maximum are kept in one in-memory set
+and regenerated together once per tick, driven by a single ticker
+subscription that only runs while the set is not empty. Resting
+characters recover faster and get one summary message per tick; everyone
+else out of combat regenerates passively and silently. Rates live in
+`world.rules`.
+"""
+
+from django.conf import settings
+from evennia.utils import logger
+
+from world import rules
+from world.ticker import TickerService
+
+VITAL_NAMES = {'hit_points': "hit points", 'mana': "mana", 'move': "move"}
+
+
+class RegenService(TickerService):
+    """
+    Set of regenerating characters, updated in one pass per tick.
+
+    Characters leave the set once all their vitals are full.
+    """
+
+    idstring = "regen_tick"
+
+    def __init__(self):
+        super().__init__()
+        self.characters = set()
+
+    def get_interval(self):
+        """Get the regeneration tick length in seconds"""
+        return getattr(settings, 'REGEN_INTERVAL', 10)
+
+    def get_callback(self):
+        return regen_tick
+
+    def has_work(self):
+        return bool(self.characters)
+
+    def add(self, character):
+        """Start regenerating character if any of its vitals is missing"""
+        if character in self.characters or not rules.needs_regen(character.stats):
+            return
+        self.characters.add(character)
+        self.update_ticker()
+
+    def remove(self, character):
+        """Stop regenerating character"""
+        self.characters.discard(character)
+        self.update_ticker()
+
+    def regenerate(self):
+        """Apply one tick of regeneration to every character in the set"""
+        for character in list(self.characters):
+            if not character.pk:
+                self.characters.discard(character)
+                continue
+            try:
+                self._regenerate(character)
+            except Exception:
+                logger.log_trace(f"Regeneration failed for {character}.")
+                self.characters.discard(character)
+
+        self.update_ticker()
+
+    def _regenerate(self, character):
+        if character.combat.in_combat:
+            return
+        stats = character.stats
+        resting = bool(character.db.is_resting)
+        gains = rules.regen_gains(stats, resting)
+        if gains:
+            stats.update(**{stat: getattr(stats, stat) + gain for stat, gain in gains.items()})
+        if not rules.needs_regen(stats):
+            self.characters.discard(character)
+        if resting and gains:
+            parts = [f"{gain} {VITAL_NAMES[stat]}" for stat, gain in gains.items()]
+            if len(parts) > 1:
+                parts = [", ".join(parts[:-1]), parts[-1]]
+            character.msg(f"You recover {' and '.join(parts)} while resting.")
+
+
+REGEN_SERVICE = RegenService()
+
+
+def regen_tick():
+    """Ticker callback regenerating every character in the set"""
+    REGEN_SERVICE.regenerate()
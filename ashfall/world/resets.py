@@ -0,0 +1,157 @@
+"""
+Zone resets for Ashfall MUD
+
+Like tbaMUD zone resets, the spawns of every zone file are restocked on
+a timer: every `interval` seconds (ZONE_RESET_INTERVAL if the zone file
+gives none), a spawn rule tops the number of its objects lying in its
+location back up to its count. Objects carried off no longer count, so a
+looted room fills up again.
+
+One scheduler, the `ZONE_RESETS`, checks the rules of all zones on a
+single ticker. Zones nobody is in are skipped, and their due rules wait
+until someone comes. Objects are counted by their zone uid tags in one
+grouped query per zone, and whatever is missing is created in one
+transaction.
+"""
+
+import time
+from dataclasses import dataclass
+
+from django.conf import settings
+from evennia.utils import logger
+
+from world.respawn import get_zone
+from world.ticker import TickerService
+from world.zone_loader import UID_TAG_CATEGORY, create_entry, find_rooms, read_zone, zone_names
+
+
+@dataclass
+class SpawnRule:
+    """A spawn of a zone file, and when it is next due"""
+
+    local_id: str
+    entry: dict
+    interval: float
+    due: float = 0
+
+
+class ZoneResetScheduler(TickerService):
+    """
+    Spawn rules of every zone, reset on one ticker that only runs while
+    there are rules.
+    """
+
+    idstring = "zone_reset"
+
+    def __init__(self):
+        super().__init__()
+        # zone -> [SpawnRule, ...]
+        self.rules = {}
+
+    def get_interval(self):
+        """Get how often due rules are checked, in seconds"""
+        return getattr(settings, 'ZONE_RESET_TICK', 30)
+
+    def get_callback(self):
+        return zone_reset_tick
+
+    def has_work(self):
+        return bool(self.rules)
+
+    def get_default_reset_interval(self):
+        """Get the reset interval of spawns that do not set their own"""
+        return getattr(settings, 'ZONE_RESET_INTERVAL', 600)
+
+    def load(self):
+        """
+        Read the spawn rules of every zone file. Rules already known keep
+        their due time; new rules are due one interval from now.
+        """
+        now = time.time()
+        default = self.get_default_reset_interval()
+        known = {(zone, rule.local_id): rule.due
+                 for zone, rules in self.rules.items() for rule in rules}
+        rules = {}
+        for name in zone_names():
+            try:
+                zone, _, entries = read_zone(name)
+            except ValueError as err:
+                logger.log_err(f"Zone resets skip zone file '{name}': {err}")
+                continue
+            zone_rules = []
+            for local_id, entry in entries.items():
+                if 'interval' in entry:
+                    interval = entry['interval'] or default
+                    due = known.get((zone, local_id), now + interval)
+                    zone_rules.append(SpawnRule(local_id, entry, interval, due))
+            if zone_rules:
+                rules[zone] = zone_rules
+        self.rules = rules
+        self.update_ticker()
+
+    def occupied_zones(self):
+        """Get the zones with a puppeted character in them"""
+        from evennia.server.sessionhandler import SESSION_HANDLER
+        zones = set()
+        for session in SESSION_HANDLER.get_sessions():
+            puppet = session.get_puppet()
+            zone = get_zone(puppet.location) if puppet else None
+            if zone:
+                zones.add(zone)
+        return zones
+
+    def reset(self, now=None):
+        """Reset the due rules of every zone with players in it"""
+        now = now or time.time()
+        occupied = None
+        for zone, rules in self.rules.items():
+            due = [rule for rule in rules if rule.due <= now]
+            if not due:
+                continue
+            if occupied is None:
+                occupied = self.occupied_zones()
+            if zone not in occupied:
+                continue
+            try:
+                self.reset_zone(zone, due)
+            except Exception:
+                logger.log_trace(f"Resetting zone {zone} failed.")
+            for rule in due:
+                rule.due = now + rule.interval
+
+    def reset_zone(self, zone, rules):
+        """
+        Top up the objects of the given rules of zone in their locations.
+
+        Returns:
+            int: The number of objects created.
+        """
+        from django.db import transaction
+        from django.db.models import Count
+        from evennia.objects.models import ObjectDB
+
+        rooms = find_rooms(zone, {rule.entry['location'] for rule in rules})
+        uids = {f"{zone}:{rule.local_id}": rule for rule in rules}
+        rows = ObjectDB.objects.filter(
+            db_tags__db_category=UID_TAG_CATEGORY, db_tags__db_key__in=list(uids),
+        ).values('db_tags__db_key', 'db_location_id').annotate(count=Count('id'))
+        counts = {(row['db_tags__db_key'], row['db_location_id']): row['count'] for row in rows}
+
+        missing = []
+        for uid, rule in uids.items():
+            room = rooms.get(rule.entry['location'])
+            if room is not None:
+                missing += [rule] * (rule.entry['count'] - counts.get((uid, room.id), 0))
+        if missing:
+            with transaction.atomic():
+                for rule in missing:
+                    create_entry(zone, rule.local_id, rule.entry, rooms)
+        return len(missing)
+
+
+ZONE_RESETS = ZoneResetScheduler()
+
+
+def zone_reset_tick():
+    """Ticker callback resetting the due spawns of occupied zones"""
+    ZONE_RESETS.reset()
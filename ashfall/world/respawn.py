@@ -0,0 +1,127 @@
+"""
+Respawn points for Ashfall MUD
+
+Where a dead character wakes up is looked up in the `RESPAWN_REGISTRY`,
+which maps respawn points to rooms. A point is a (kind, name) pair,
+checked in this order:
+
+    character   - a single character, named by object id
+    faction     - every character whose `db.faction` is the name
+    zone        - deaths in rooms tagged with the name in the "zone"
+                  tag category
+    default     - everyone else; the name is empty
+
+Points are persisted by dbref in one ServerConfig entry and resolved to
+room objects in a single query at server start, so a death costs no
+database queries. They are managed in game with the `respawn` command.
+"""
+
+from evennia.utils import logger
+
+KINDS = ('character', 'faction', 'zone', 'default')
+ZONE_TAG_CATEGORY = "zone"
+# the room used before respawn points existed, adopted as the default
+LEGACY_DEFAULT_ROOM = "Ruined Neighborhood"
+
+
+def get_zone(room):
+    """
+    Get the zone name of room, or None. A room tagged with several zones
+    counts as the first of them in alphabetical order.
+    """
+    zones = room.tags.get(category=ZONE_TAG_CATEGORY, return_list=True) if room else None
+    return min(zones) if zones else None
+
+
+class RespawnRegistry:
+    """Respawn point -> room, cached in memory"""
+
+    config_key = "respawn_points"
+
+    def __init__(self):
+        self.rooms = None
+
+    def load(self):
+        """Resolve every stored respawn point in one query"""
+        from evennia.objects.models import ObjectDB
+        from evennia.server.models import ServerConfig
+        points = ServerConfig.objects.conf(self.config_key, default=None) or {}
+        found = {obj.id: obj for obj in ObjectDB.objects.filter(id__in=points.values())}
+        self.rooms = {point: found[dbid] for point, dbid in points.items() if dbid in found}
+        if len(self.rooms) != len(points):
+            logger.log_warn("Dropped respawn points whose rooms no longer exist.")
+            self._save()
+        if ('default', '') not in self.rooms:
+            self._adopt_legacy_default()
+
+    def _adopt_legacy_default(self):
+        from evennia.utils.search import search_object
+        rooms = search_object(LEGACY_DEFAULT_ROOM)
+        if rooms:
+            self.set('default', '', rooms[0])
+
+    def _save(self):
+        from evennia.server.models import ServerConfig
+        ServerConfig.objects.conf(self.config_key,
+                                  value={point: room.id for point, room in self.rooms.items()})
+
+    @staticmethod
+    def _point(kind, name):
+        if kind not in KINDS:
+            raise ValueError(f"Unknown respawn point kind '{kind}'; use one of {', '.join(KINDS)}.")
+        return kind, '' if kind == 'default' else str(name).lower()
+
+    def points(self):
+        """Get every respawn point as sorted ((kind, name), room) pairs"""
+        if self.rooms is None:
+            self.load()
+        return sorted(self.rooms.items(), key=lambda item: (KINDS.index(item[0][0]), item[0][1]))
+
+    def set(self, kind, name, room):
+        """
+        Make room the respawn point for (kind, name).
+
+        Raises:
+            ValueError: If kind is unknown.
+        """
+        point = self._point(kind, name)
+        if self.rooms is None:
+            self.load()
+        self.rooms[point] = room
+        self._save()
+
+    def clear(self, kind, name=''):
+        """
+        Remove a respawn point.
+
+        Returns:
+            bool: False if there was no such point.
+        """
+        point = self._point(kind, name)
+        if self.rooms is None:
+            self.load()
+        if self.rooms.pop(point, None) is None:
+            return False
+        self._save()
+        return True
+
+    def get_respawn_room(self, character):
+        """Get the room character respawns in, falling back to its home"""
+        if self.rooms is None:
+            self.load()
+        candidates = [('character', str(character.id))]
+        faction = character.db.faction
+        if faction:
+            candidates.append(('faction', str(faction).lower()))
+        zone = get_zone(character.location)
+        if zone:
+            candidates.append(('zone', zone.lower()))
+        candidates.append(('default', ''))
+        for point in candidates:
+            room = self.rooms.get(point)
+            if room and room.pk:
+                return room
+        return character.home
+
+
+RESPAWN_REGISTRY = RespawnRegistry()
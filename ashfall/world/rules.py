@@ -0,0 +1,294 @@
+"""
+Game rules for Ashfall MUD
+
+Pure formulas shared by the typeclasses, the combat engine and the
+headless simulator (`world.simulator`). This module has no Evennia
+dependencies.
+
+Progression rules work on any stat record with attribute access, such as
+a character's `db` handler or a plain in-memory object.
+
+Combat rounds are resolved in bulk by `resolve_attacks`. When NumPy is
+installed every hit check and damage roll of the round is computed in a
+single vectorized pass; otherwise the same rules run in plain Python.
+"""
+
+import random
+from bisect import bisect_right
+from functools import lru_cache
+
+from world.classes import ABILITIES, apply_deltas, get_advanced_class, get_class
+from world.dice import DiceExpression, compile_dice
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+BASE_HIT_CHANCE = 50
+UNARMED_DAMAGE = compile_dice("1d4")
+
+_NP_RNG = np.random.default_rng() if np is not None else None
+
+# Values every new character starts with
+STARTING_STATS = {
+    'level': 1,
+    'experience': 0,
+    'remorts': 0,
+    'strength': 10,
+    'intelligence': 10,
+    'wisdom': 10,
+    'dexterity': 10,
+    'constitution': 10,
+    'charisma': 10,
+    'hit_points': 100,
+    'max_hit_points': 100,
+    'mana': 0,
+    'max_mana': 0,
+    'move': 100,
+    'max_move': 100,
+    'armor_class': 0,
+    'damage_bonus': 0,
+    'hit_bonus': 0,
+}
+
+
+def hit_chance(hit_bonus, armor_class):
+    """Percent chance to hit a target with the given armor class"""
+    return BASE_HIT_CHANCE + hit_bonus - armor_class
+
+
+def strength_damage_bonus(strength):
+    """Extra damage granted by strength above 10"""
+    return (strength - 10) // 2 if strength > 10 else 0
+
+
+def resolve_attack(hit_bonus, armor_class, damage_dice, damage_bonus, strength, rng=random):
+    """
+    Resolve a single attack.
+
+    Returns:
+        int: Damage dealt, 0 for a miss.
+    """
+    if rng.randint(1, 100) > hit_chance(hit_bonus, armor_class):
+        return 0
+    damage = damage_dice.roll(rng) + damage_bonus + strength_damage_bonus(strength)
+    return max(1, damage)
+
+
+def resolve_attacks(hit_bonus, armor_class, damage_dice, damage_bonus, strength, rng=None):
+    """
+    Resolve every attack of a combat round at once.
+
+    All arguments are equal-length sequences, one entry per attack.
+
+    Args:
+        hit_bonus (sequence): Attacker hit bonuses.
+        armor_class (sequence): Target armor classes.
+        damage_dice (sequence): Compiled `DiceExpression` per attacker.
+        damage_bonus (sequence): Attacker damage bonuses.
+        strength (sequence): Attacker strength.
+        rng (Generator or Random, optional): Source of randomness; a NumPy
+            Generator when NumPy is used, otherwise a `random.Random`.
+
+    Returns:
+        list: Damage per attack, 0 for a miss.
+    """
+    if not damage_dice:
+        return []
+    if np is None:
+        rng = rng or random
+        return [resolve_attack(*attack, rng=rng) for attack in
+                zip(hit_bonus, armor_class, damage_dice, damage_bonus, strength)]
+
+    rng = rng or _NP_RNG
+    count = len(damage_dice)
+    hit_bonus = np.asarray(hit_bonus, dtype=np.int64)
+    armor_class = np.asarray(armor_class, dtype=np.int64)
+    strength = np.asarray(strength, dtype=np.int64)
+
+    hits = rng.integers(1, 101, size=count) <= BASE_HIT_CHANCE + hit_bonus - armor_class
+    damage = _roll_dice_array(damage_dice, rng)
+    damage += np.asarray(damage_bonus, dtype=np.int64)
+    damage += np.where(strength > 10, (strength - 10) // 2, 0)
+    damage = np.where(hits, np.maximum(damage, 1), 0)
+    return damage.tolist()
+
+
+def _roll_dice_array(damage_dice, rng):
+    """Roll one dice expression per entry, grouping identical expressions"""
+    totals = np.zeros(len(damage_dice), dtype=np.int64)
+    groups = {}
+    for index, expression in enumerate(damage_dice):
+        if not isinstance(expression, DiceExpression):
+            expression = compile_dice(expression)
+        groups.setdefault(expression, []).append(index)
+
+    for expression, indices in groups.items():
+        indices = np.asarray(indices)
+        if expression.simple_terms is None:
+            # exploding and keep-highest dice are rare; roll them one by one,
+            # from the same generator so seeded rounds stay reproducible
+            rolls = [expression.roll(rng) for _ in range(len(indices))]
+            totals[indices] = rolls
+            continue
+        group_total = np.full(len(indices), expression.modifier, dtype=np.int64)
+        for dice_count, sides in expression.simple_terms:
+            group_total += rng.integers(1, sides + 1, size=(len(indices), dice_count)).sum(axis=1)
+        totals[indices] = group_total
+    return totals
+
+
+# Progression
+
+
+def exp_for_level(level, multiplier=1.2):
+    """Calculate experience required for a given level"""
+    if level <= 1:
+        return 0
+    return int(1000 * (level - 1) * (level - 1) * multiplier)
+
+
+@lru_cache(maxsize=None)
+def exp_table(max_level, multiplier=1.2):
+    """
+    Experience thresholds of every level up to max_level, built once.
+
+    Returns:
+        tuple: Indexed by level; entry 0 is unused and equals entry 1.
+    """
+    return tuple(exp_for_level(level, multiplier) for level in range(max_level + 1))
+
+
+def level_for_experience(table, experience):
+    """Highest level in table reached with the given experience"""
+    return max(1, bisect_right(table, experience) - 1)
+
+
+def apply_class_bonuses(record):
+    """Apply class-specific stat bonuses and grant the class skills and spells"""
+    character_class = get_class(record.class_name)
+    if not character_class:
+        return
+    apply_deltas(record, character_class.deltas)
+    if character_class.skills:
+        record.skills = dict(character_class.skills)
+    if character_class.spells:
+        record.known_spells = set(character_class.spells)
+
+
+def increase_stats_on_level(record):
+    """Increase stats on level up based on class"""
+    character_class = get_class(record.class_name)
+    if character_class:
+        apply_deltas(record, character_class.level_stats)
+
+
+def hp_gain(record):
+    """Calculate hit point gain on level up"""
+    character_class = get_class(record.class_name)
+    if not character_class:
+        return 1
+    return max(1, ((record.constitution or 10) - 10) // 2 + character_class.hp_per_level)
+
+
+def mana_gain(record):
+    """Calculate mana gain on level up"""
+    character_class = get_class(record.class_name)
+    if not character_class or not character_class.mana_stats:
+        return 0
+    return sum((getattr(record, stat) or 10) // 2
+               for stat in character_class.mana_stats) + character_class.mana_per_level
+
+
+def apply_advanced_class_bonuses(record):
+    """Apply advanced class bonuses"""
+    advanced_class = get_advanced_class(record.advanced_class)
+    if advanced_class:
+        apply_deltas(record, advanced_class.deltas)
+
+
+def apply_level(record):
+    """
+    Apply one level of gains to record.
+
+    Returns:
+        tuple: (hp_gain, mana_gain)
+    """
+    record.level += 1
+    increase_stats_on_level(record)
+
+    hp = hp_gain(record)
+    record.hit_points += hp
+    record.max_hit_points += hp
+
+    mana = mana_gain(record)
+    if mana > 0:
+        record.mana += mana
+        record.max_mana += mana
+    return hp, mana
+
+
+def apply_levels(record, levels):
+    """
+    Apply several levels of gains to record.
+
+    Returns:
+        tuple: (total hp_gain, total mana_gain)
+    """
+    total_hp = total_mana = 0
+    for _ in range(levels):
+        hp, mana = apply_level(record)
+        total_hp += hp
+        total_mana += mana
+    return total_hp, total_mana
+
+
+def apply_remort(record):
+    """Reset record for a new remort, keeping class and max vitals"""
+    record.remorts += 1
+    record.level = 1
+    record.experience = 0
+
+    # Reset stats but keep some bonuses
+    for ability in ABILITIES:
+        setattr(record, ability, STARTING_STATS[ability])
+
+    # Apply class bonuses again
+    apply_class_bonuses(record)
+
+    # Reset hit points and mana
+    record.hit_points = record.max_hit_points
+    record.mana = record.max_mana
+
+
+# Regeneration
+
+# (stat, max_stat) of every vital that regenerates
+VITALS = (('hit_points', 'max_hit_points'), ('mana', 'max_mana'), ('move', 'max_move'))
+
+# Gains per regeneration tick
+RESTING_REGEN = {'hit_points': 5, 'mana': 3, 'move': 5}
+PASSIVE_REGEN = {'hit_points': 1, 'mana': 1, 'move': 2}
+
+
+def needs_regen(record):
+    """Check if any vital of record is below its maximum"""
+    return any((getattr(record, stat) or 0) < (getattr(record, max_stat) or 0)
+               for stat, max_stat in VITALS)
+
+
+def regen_gains(record, resting):
+    """
+    Calculate one regeneration tick, capped at the maximums.
+
+    Returns:
+        dict: stat -> gain, only for vitals that gain anything.
+    """
+    rates = RESTING_REGEN if resting else PASSIVE_REGEN
+    gains = {}
+    for stat, max_stat in VITALS:
+        missing = (getattr(record, max_stat) or 0) - (getattr(record, stat) or 0)
+        if missing > 0 and rates[stat]:
+            gains[stat] = min(rates[stat], missing)
+    return gains
@@ -0,0 +1,286 @@
+"""
+Headless combat and progression simulator for Ashfall MUD
+
+Drives the rules in `world.rules` against plain in-memory stat records, so
+combat and leveling throughput and class balance can be measured without
+booting Evennia or a database.
+
+Run it from the game directory:
+
+    python -m world.simulator
+    python -m world.simulator --fights 5000 --level 30 --seed 1
+    python -m world.simulator --json --min-fights-per-sec 2000 --max-win-rate 0.8
+
+With any of the threshold options given, it exits with status 1 when a
+threshold is missed, so it can guard CI against performance and balance
+regressions in the same run.
+
+Fights are duels in which both sides attack every round with the same
+weapon, so outcomes only depend on class, level and advanced class.
+Spells are not simulated.
+"""
+
+import argparse
+import itertools
+import json
+import random
+import sys
+import time
+
+from world import rules
+from world.classes import CLASSES
+from world.dice import compile_dice
+
+MAX_ROUNDS = 500
+
+
+class StatRecord:
+    """In-memory stand-in for a character's `db` handler"""
+
+    def __init__(self, class_name=None, **stats):
+        self.__dict__.update(rules.STARTING_STATS)
+        self.class_name = class_name
+        self.advanced_class = None
+        self.skills = {}
+        self.known_spells = set()
+        self.__dict__.update(stats)
+
+
+def build_character(class_name, level=1, advanced_class=None):
+    """Create a record of the given class, levelled up the normal way"""
+    record = StatRecord(class_name)
+    rules.apply_class_bonuses(record)
+    for _ in range(level - 1):
+        rules.apply_level(record)
+    if advanced_class:
+        record.advanced_class = advanced_class
+        rules.apply_advanced_class_bonuses(record)
+    return record
+
+
+def make_rng(seed=None):
+    """Get the random source `rules.resolve_attacks` expects"""
+    if rules.np is not None:
+        return rules.np.random.default_rng(seed)
+    return random.Random(seed)
+
+
+def run_fights(pairs, weapon, rng, max_rounds=MAX_ROUNDS):
+    """
+    Fight every pair of records to the end, all duels advancing together.
+
+    Every round of every ongoing duel is resolved in one
+    `rules.resolve_attacks` call, like the live combat engine does.
+
+    Returns:
+        tuple: (results, rounds) where results holds 0 if the first record
+            won, 1 if the second did and None for a draw, and rounds is the
+            total number of duel rounds fought.
+    """
+    hit_points = [[a.hit_points, b.hit_points] for a, b in pairs]
+    sides = []
+    for a, b in pairs:
+        sides.append(((a.hit_bonus, b.armor_class, weapon, a.damage_bonus, a.strength),
+                      (b.hit_bonus, a.armor_class, weapon, b.damage_bonus, b.strength)))
+
+    results = [None] * len(pairs)
+    active = list(range(len(pairs)))
+    rounds = 0
+    while active and rounds < max_rounds * len(pairs):
+        columns = ([], [], [], [], [])
+        for index in active:
+            for attack in sides[index]:
+                for column, value in zip(columns, attack):
+                    column.append(value)
+        damage = rules.resolve_attacks(*columns, rng=rng)
+        rounds += len(active)
+
+        still_active = []
+        for position, index in enumerate(active):
+            hp = hit_points[index]
+            hp[1] -= damage[2 * position]
+            hp[0] -= damage[2 * position + 1]
+            if hp[0] > 0 and hp[1] > 0:
+                still_active.append(index)
+            elif hp[1] <= 0 < hp[0]:
+                results[index] = 0
+            elif hp[0] <= 0 < hp[1]:
+                results[index] = 1
+        active = still_active
+    return results, rounds
+
+
+def benchmark_combat(fights, level, weapon, rng):
+    """Measure fights and rounds per second over random class pairings"""
+    roster = {name: build_character(name, level) for name in CLASSES}
+    classes = list(CLASSES)
+    pick = random.Random(fights).choice
+    pairs = [(roster[pick(classes)], roster[pick(classes)]) for _ in range(fights)]
+
+    start = time.perf_counter()
+    _, rounds = run_fights(pairs, weapon, rng)
+    elapsed = max(time.perf_counter() - start, 1e-9)
+    return {
+        'fights': fights,
+        'rounds': rounds,
+        'seconds': elapsed,
+        'fights_per_sec': fights / elapsed,
+        'rounds_per_sec': rounds / elapsed,
+    }
+
+
+def benchmark_progression(characters, max_level, remorts):
+    """Measure level-ups per second through full level and remort cycles"""
+    level_ups = 0
+    start = time.perf_counter()
+    for class_name in itertools.islice(itertools.cycle(CLASSES), characters):
+        record = build_character(class_name)
+        for _ in range(remorts + 1):
+            while record.level < max_level:
+                rules.apply_level(record)
+                level_ups += 1
+            rules.apply_remort(record)
+        record.advanced_class = CLASSES[class_name].advanced[0]
+        rules.apply_advanced_class_bonuses(record)
+    elapsed = max(time.perf_counter() - start, 1e-9)
+    return {
+        'characters': characters,
+        'level_ups': level_ups,
+        'seconds': elapsed,
+        'level_ups_per_sec': level_ups / elapsed,
+    }
+
+
+def balance(roster, duels, weapon, rng):
+    """
+    Round-robin duels between every pair in roster.
+
+    Args:
+        roster (dict): Name -> stat record.
+        duels (int): Duels per pairing.
+
+    Returns:
+        dict: Name -> overall win rate.
+    """
+    names = list(roster)
+    pairs = []
+    matchups = []
+    for first, second in itertools.combinations(names, 2):
+        pairs.extend([(roster[first], roster[second])] * duels)
+        matchups.extend([(first, second)] * duels)
+    results, _ = run_fights(pairs, weapon, rng)
+
+    wins = dict.fromkeys(names, 0)
+    fought = dict.fromkeys(names, 0)
+    for (first, second), result in zip(matchups, results):
+        fought[first] += 1
+        fought[second] += 1
+        if result is not None:
+            wins[(first, second)[result]] += 1
+    return {name: wins[name] / fought[name] if fought[name] else 0.0 for name in names}
+
+
+def run(fights=2000, level=20, duels=200, weapon="1d8", progression=200,
+        max_level=50, remorts=1, seed=None):
+    """Run every benchmark and balance check and return the report"""
+    rng = make_rng(seed)
+    weapon = compile_dice(weapon)
+
+    base_roster = {name: build_character(name, level) for name in CLASSES}
+    advanced_roster = {}
+    for character_class in CLASSES.values():
+        for advanced_class in character_class.advanced:
+            advanced_roster[advanced_class] = build_character(character_class.key, max_level,
+                                                              advanced_class)
+    return {
+        'engine': 'numpy' if rules.np is not None else 'python',
+        'combat': benchmark_combat(fights, level, weapon, rng),
+        'progression': benchmark_progression(progression, max_level, remorts),
+        'balance': {
+            'classes': balance(base_roster, duels, weapon, rng),
+            'advanced_classes': balance(advanced_roster, duels, weapon, rng),
+        },
+    }
+
+
+def check(report, min_fights_per_sec=None, min_level_ups_per_sec=None,
+          max_win_rate=None, min_win_rate=None):
+    """
+    Compare a report against thresholds.
+
+    Returns:
+        list: Failure messages, empty if every threshold was met.
+    """
+    failures = []
+    combat = report['combat']
+    if min_fights_per_sec is not None and combat['fights_per_sec'] < min_fights_per_sec:
+        failures.append(f"fights/sec {combat['fights_per_sec']:.0f} < {min_fights_per_sec}")
+    level_ups = report['progression']['level_ups_per_sec']
+    if min_level_ups_per_sec is not None and level_ups < min_level_ups_per_sec:
+        failures.append(f"level-ups/sec {level_ups:.0f} < {min_level_ups_per_sec}")
+    for group in report['balance'].values():
+        for name, rate in group.items():
+            if max_win_rate is not None and rate > max_win_rate:
+                failures.append(f"{name} win rate {rate:.2f} > {max_win_rate}")
+            if min_win_rate is not None and rate < min_win_rate:
+                failures.append(f"{name} win rate {rate:.2f} < {min_win_rate}")
+    return failures
+
+
+def format_report(report):
+    """Format a report as readable text"""
+    combat = report['combat']
+    progression = report['progression']
+    lines = [
+        f"Engine: {report['engine']}",
+        "",
+        f"Combat: {combat['fights']} fights, {combat['rounds']} rounds "
+        f"in {combat['seconds']:.3f}s",
+        f"  {combat['fights_per_sec']:.0f} fights/sec, "
+        f"{combat['rounds_per_sec']:.0f} rounds/sec",
+        f"Progression: {progression['level_ups']} level-ups "
+        f"in {progression['seconds']:.3f}s",
+        f"  {progression['level_ups_per_sec']:.0f} level-ups/sec",
+    ]
+    for title, group in (("Class win rates", report['balance']['classes']),
+                         ("Advanced class win rates", report['balance']['advanced_classes'])):
+        lines.extend(["", f"{title}:"])
+        for name, rate in sorted(group.items(), key=lambda item: -item[1]):
+            lines.append(f"  {name:<12} {rate:6.1%}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless Ashfall combat and progression simulator")
+    parser.add_argument("--fights", type=int, default=2000, help="fights in the combat benchmark")
+    parser.add_argument("--level", type=int, default=20, help="level of the base-class fighters")
+    parser.add_argument("--duels", type=int, default=200, help="duels per balance matchup")
+    parser.add_argument("--weapon", default="1d8", help="damage dice every fighter uses")
+    parser.add_argument("--progression", type=int, default=200,
+                        help="characters in the progression benchmark")
+    parser.add_argument("--max-level", type=int, default=50, help="level cap")
+    parser.add_argument("--remorts", type=int, default=1,
+                        help="remorts per character in the progression benchmark")
+    parser.add_argument("--seed", type=int, default=None, help="random seed")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    parser.add_argument("--min-fights-per-sec", type=float)
+    parser.add_argument("--min-level-ups-per-sec", type=float)
+    parser.add_argument("--max-win-rate", type=float)
+    parser.add_argument("--min-win-rate", type=float)
+    args = parser.parse_args(argv)
+
+    report = run(fights=args.fights, level=args.level, duels=args.duels, weapon=args.weapon,
+                 progression=args.progression, max_level=args.max_level,
+                 remorts=args.remorts, seed=args.seed)
+    failures = check(report, args.min_fights_per_sec, args.min_level_ups_per_sec,
+                     args.max_win_rate, args.min_win_rate)
+    report['failures'] = failures
+
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+    if failures and not args.json:
+        print("\nFAILED:\n  " + "\n  ".join(failures))
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+"""
+Skills for Ashfall MUD
+
+Every skill is a read-only `Skill` record in the `SKILLS` catalog, keyed
+by id. Characters only store skill id -> proficiency in `db.skills`;
+everything else about a skill is read from here, so changing a skill
+never needs a migration of existing characters. Spells have their own
+catalog in `world.spells`.
+
+This module has no Evennia dependencies.
+"""
+
+from dataclasses import dataclass
+from types import MappingProxyType
+
+MAX_PROFICIENCY = 100
+
+
+@dataclass(frozen=True)
+class Skill:
+    """A trainable skill"""
+
+    key: str
+    name: str
+    description: str
+
+
+def _load_skills(*skills):
+    catalog = {}
+    for skill in skills:
+        if skill.key in catalog:
+            raise ValueError(f"Skill '{skill.key}' is defined twice.")
+        catalog[skill.key] = skill
+    return MappingProxyType(catalog)
+
+
+SKILLS = _load_skills(
+    # Warrior
+    Skill('sword', "Sword", "Fighting with bladed weapons"),
+    Skill('shield', "Shield", "Blocking blows with a shield"),
+    Skill('armor', "Armor", "Moving and fighting in heavy armor"),
+    # Thief
+    Skill('stealth', "Stealth", "Staying unseen"),
+    Skill('lockpick', "Lockpick", "Opening locks without the key"),
+    Skill('sneak', "Sneak", "Moving without being noticed"),
+)
+
+
+def get_skill(key):
+    """Get the `Skill` with the given id, or None"""
+    return SKILLS.get(key)
@@ -0,0 +1,170 @@
+"""
+Spawner for Ashfall MUD
+
+Evennia's spawner searches the module and database prototypes, merges
+the inheritance chain and validates the result on every call. Zone
+resets, loot drops and events spawn the same few items over and over, so
+this front-end does that work once: the module prototypes of
+`world.prototypes` are flattened and checked when this module is
+imported, and a bad prototype fails the import with a ValueError rather
+than the first spawn.
+
+    from world.spawner import spawn
+    spawn("RUSTY_PIPE", location=room)
+    spawn("BOTTLE_CAP", count=5, location=corpse)
+
+Spawning creates the objects straight from the cached flat prototype
+with `create_object`, without going through Evennia's spawner. Values
+are used as they are, so protfuncs and `exec` are not supported. Objects
+are still tagged with their prototype key, so `spawn/update` works on
+them as usual.
+"""
+
+from types import MappingProxyType
+
+import world.prototypes
+
+META_KEYS = ('prototype_key', 'prototype_parent', 'prototype_desc', 'prototype_tags',
+             'prototype_locks')
+RESERVED_KEYS = META_KEYS + ('key', 'aliases', 'typeclass', 'location', 'home', 'destination',
+                             'permissions', 'locks', 'tags', 'attrs')
+
+
+def module_prototypes(module):
+    """Get the prototypes of module, by their lower-case variable name"""
+    return {name.lower(): value for name, value in vars(module).items()
+            if name.isupper() and isinstance(value, dict)}
+
+
+def _homogenize(key, prototype):
+    """
+    Bring prototype to the form Evennia spawns: tags as (tag, category,
+    data) and every non-reserved key moved into attrs as (name, value,
+    category, locks).
+    """
+    homogenized = {'attrs': [], 'tags': []}
+    for name, value in prototype.items():
+        if name == 'exec':
+            raise ValueError(f"Prototype '{key}' uses exec, which the spawner does not run.")
+        if name == 'attrs':
+            for attr in value:
+                if not isinstance(attr, (tuple, list)) or not 2 <= len(attr) <= 4:
+                    raise ValueError(f"Prototype '{key}' has a malformed attr: {attr!r}.")
+                homogenized['attrs'].append((*attr, None, "")[:4])
+        elif name == 'tags':
+            for tag in value:
+                tag = tag if isinstance(tag, (tuple, list)) else (tag,)
+                if not 1 <= len(tag) <= 3:
+                    raise ValueError(f"Prototype '{key}' has a malformed tag: {tag!r}.")
+                homogenized['tags'].append((*tag, None, None)[:3])
+        elif name == 'aliases':
+            homogenized['aliases'] = [value] if isinstance(value, str) else list(value)
+        elif name in RESERVED_KEYS or name.startswith('ndb_'):
+            homogenized[name] = value
+        else:
+            homogenized['attrs'].append((name, value, None, ""))
+    return homogenized
+
+
+def _merge(base, child):
+    """Overlay child on base, merging attrs and tags by name and category"""
+    merged = {**base, **child}
+    merged['attrs'] = list({(attr[0], attr[2]): attr
+                            for attr in base.get('attrs', []) + child['attrs']}.values())
+    merged['tags'] = list({(tag[0], tag[1]): tag
+                           for tag in base.get('tags', []) + child['tags']}.values())
+    return merged
+
+
+def resolve_prototypes(prototypes):
+    """
+    Flatten the inheritance of prototypes, a dict of prototype key ->
+    prototype. Like Evennia, later parents override earlier ones and the
+    child overrides them all.
+
+    Returns:
+        dict: Prototype key -> flat prototype, without `prototype_parent`.
+
+    Raises:
+        ValueError: If a parent is missing or inherits from itself, an
+            attr or tag is malformed, exec is used, or a prototype with a
+            key has no typeclass.
+    """
+    resolved = {}
+
+    def resolve(key, chain=()):
+        if key in resolved:
+            return resolved[key]
+        if key in chain:
+            raise ValueError(f"Prototype '{key}' inherits from itself: "
+                             f"{' -> '.join(chain + (key,))}.")
+        if key not in prototypes:
+            raise ValueError(f"Prototype '{chain[-1]}' has an unknown parent '{key}'.")
+        prototype = _homogenize(key, prototypes[key])
+        parents = prototype.pop('prototype_parent', ())
+        flat = {}
+        for parent in [parents] if isinstance(parents, str) else parents:
+            flat = _merge(flat, resolve(parent.lower(), chain + (key,)))
+        flat = _merge(flat, prototype)
+        flat['prototype_key'] = prototypes[key].get('prototype_key', key).lower()
+        if 'key' in flat and not isinstance(flat.get('typeclass'), str):
+            raise ValueError(f"Prototype '{key}' has no typeclass.")
+        resolved[key] = flat
+        return flat
+
+    for key in prototypes:
+        resolve(key)
+    return resolved
+
+
+PROTOTYPES = MappingProxyType(resolve_prototypes(module_prototypes(world.prototypes)))
+
+
+def get_prototype(prototype_key):
+    """
+    Get a copy of the flat prototype of prototype_key.
+
+    Raises:
+        ValueError: If there is no such prototype, or it has no key and
+            is only meant as a parent.
+    """
+    prototype = PROTOTYPES.get(prototype_key.lower())
+    if prototype is None:
+        raise ValueError(f"There is no prototype '{prototype_key}'.")
+    if 'key' not in prototype:
+        raise ValueError(f"Prototype '{prototype_key}' is only a parent and cannot be spawned.")
+    return {name: list(value) if isinstance(value, list) else value
+            for name, value in prototype.items()}
+
+
+def spawn(prototype_key, count=1, **overrides):
+    """
+    Spawn count objects of a module prototype.
+
+    Keyword Args:
+        count (int): How many objects to spawn.
+        **overrides: Prototype fields to set, like `location`. `tags` and
+            `attrs` are added to those of the prototype.
+
+    Returns:
+        list: The spawned objects.
+
+    Raises:
+        ValueError: If the prototype cannot be spawned.
+    """
+    from evennia.prototypes.prototypes import PROTOTYPE_TAG_CATEGORY
+    from evennia.utils.create import create_object
+
+    prototype = get_prototype(prototype_key)
+    if overrides:
+        prototype = _merge(prototype, _homogenize(prototype_key, overrides))
+    tags = prototype['tags'] + [(prototype['prototype_key'], PROTOTYPE_TAG_CATEGORY)]
+    nattributes = [(name[4:], value) for name, value in prototype.items()
+                   if name.startswith('ndb_')]
+    return [create_object(prototype['typeclass'], key=prototype['key'],
+                          location=prototype.get('location'), home=prototype.get('home'),
+                          destination=prototype.get('destination'),
+                          aliases=prototype.get('aliases'), locks=prototype.get('locks'),
+                          permissions=prototype.get('permissions'), tags=tags,
+                          attributes=prototype['attrs'], nattributes=nattributes or None)
+            for _ in range(count)]
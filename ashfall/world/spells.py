@@ -0,0 +1,171 @@
+"""
+Spells for Ashfall MUD
+
+Every spell is a read-only `Spell` record in the `SPELLS` catalog, keyed by
+name. A record carries the mana cost, the targeting rule, the effect to run
+and the message templates, so casting is one lookup plus one effect call.
+Costs live only here; characters just store the set of spell keys they
+know, in `db.known_spells`.
+
+Targeting rules:
+
+    none    - the spell has no target
+    self    - affects the given target, or the caster if none is given
+    other   - needs a target other than the caster
+
+Message templates are formatted with `caster`, `target` and `amount`.
+
+This module has no Evennia dependencies.
+"""
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Callable, Optional
+
+from world.effects import EFFECTS
+
+TARGETING = ('none', 'self', 'other')
+
+
+# Effects. Each is called as effect(caster, target, spell) with the target
+# already resolved by the targeting rule.
+
+
+def no_effect(caster, target, spell):
+    """Effect of spells that only produce messages"""
+
+
+def restore_hit_points(caster, target, spell):
+    """Heal target by the spell's amount"""
+    target.heal(spell.amount)
+
+
+def deal_damage(caster, target, spell):
+    """Damage target by the spell's amount"""
+    target.take_damage(spell.amount)
+
+
+def apply_timed_effect(caster, target, spell):
+    """Apply the spell's timed effect to target"""
+    target.effects.add(spell.timed_effect)
+
+
+@dataclass(frozen=True)
+class Spell:
+    """A castable spell"""
+
+    key: str
+    cost: int
+    level: int
+    targeting: str
+    effect: Callable
+    amount: int = 0
+    # key in `world.effects.EFFECTS`, used by apply_timed_effect
+    timed_effect: Optional[str] = None
+    # sent to the caster when casting at someone else, or with no target
+    caster_msg: str = ""
+    target_msg: Optional[str] = None
+    room_msg: Optional[str] = None
+    # sent to the caster instead of caster_msg when the caster is the target
+    self_msg: Optional[str] = None
+    no_target_msg: Optional[str] = None
+
+    def resolve_target(self, caster, target):
+        """
+        Apply the targeting rule.
+
+        Returns:
+            The object the spell affects, or None if the spell cannot be
+            cast at target.
+        """
+        if self.targeting == 'none':
+            return caster
+        if self.targeting == 'self':
+            return target or caster
+        if target is None or target is caster:
+            return None
+        return target
+
+    def cast(self, caster, target):
+        """Run the effect on an already resolved target and send the messages"""
+        self.effect(caster, target, self)
+
+        if target is caster and self.self_msg:
+            caster.msg(self.self_msg.format(caster=caster.key, amount=self.amount))
+            return
+        mapping = {'caster': caster.key, 'target': target.key, 'amount': self.amount}
+        caster.msg(self.caster_msg.format(**mapping))
+        exclude = [caster]
+        if self.target_msg and target is not caster:
+            target.msg(self.target_msg.format(**mapping))
+            exclude.append(target)
+        if self.room_msg and caster.location:
+            caster.location.msg_contents(self.room_msg.format(**mapping), exclude=exclude)
+
+
+def _load_spells(*spells):
+    catalog = {}
+    for spell in spells:
+        if spell.key in catalog:
+            raise ValueError(f"Spell '{spell.key}' is defined twice.")
+        if spell.targeting not in TARGETING:
+            raise ValueError(f"Spell '{spell.key}' has unknown targeting '{spell.targeting}'.")
+        if spell.timed_effect and spell.timed_effect not in EFFECTS:
+            raise ValueError(f"Spell '{spell.key}' uses unknown effect '{spell.timed_effect}'.")
+        if spell.targeting == 'other' and not spell.no_target_msg:
+            raise ValueError(f"Spell '{spell.key}' needs a no_target_msg.")
+        catalog[spell.key] = spell
+    return MappingProxyType(catalog)
+
+
+SPELLS = _load_spells(
+    # Cleric
+    Spell('heal', cost=20, level=1, targeting='self', effect=restore_hit_points, amount=20,
+          caster_msg="You heal {target} for {amount} hit points.",
+          target_msg="{caster} heals you for {amount} hit points.",
+          self_msg="You heal yourself for {amount} hit points."),
+    Spell('cure_light', cost=10, level=1, targeting='self', effect=restore_hit_points, amount=10,
+          caster_msg="You cure {target} for {amount} hit points.",
+          target_msg="{caster} cures you for {amount} hit points.",
+          self_msg="You cure yourself for {amount} hit points."),
+    Spell('bless', cost=15, level=1, targeting='self', effect=apply_timed_effect,
+          timed_effect='bless',
+          caster_msg="You bless {target}.",
+          target_msg="{caster} blesses you.",
+          self_msg="You bless yourself."),
+    # Mage
+    Spell('fireball', cost=15, level=1, targeting='other', effect=deal_damage, amount=15,
+          caster_msg="You cast fireball at {target} for {amount} damage!",
+          target_msg="{caster} casts fireball at you for {amount} damage!",
+          room_msg="{caster} casts fireball at {target}!",
+          no_target_msg="You need a target for fireball."),
+    Spell('magic_missile', cost=10, level=1, targeting='other', effect=deal_damage, amount=8,
+          caster_msg="You cast magic missile at {target} for {amount} damage!",
+          target_msg="{caster} casts magic missile at you for {amount} damage!",
+          room_msg="{caster} casts magic missile at {target}!",
+          no_target_msg="You need a target for magic missile."),
+    Spell('light', cost=5, level=1, targeting='none', effect=no_effect,
+          caster_msg="You cast light, illuminating the area.",
+          room_msg="{caster} casts light, illuminating the area."),
+    # Psionicist
+    Spell('mind_blast', cost=12, level=1, targeting='other', effect=deal_damage, amount=12,
+          caster_msg="You blast {target}'s mind for {amount} damage!",
+          target_msg="{caster} blasts your mind for {amount} damage!",
+          room_msg="{caster} blasts {target}'s mind!",
+          no_target_msg="You need a target for mind blast."),
+    Spell('telekinesis', cost=8, level=1, targeting='other', effect=no_effect,
+          caster_msg="You use telekinesis on {target}.",
+          target_msg="{caster} uses telekinesis on you.",
+          room_msg="{caster} uses telekinesis on {target}!",
+          no_target_msg="You need a target for telekinesis."),
+    Spell('mind_scan', cost=5, level=1, targeting='other', effect=no_effect,
+          caster_msg="You scan {target}'s mind.",
+          target_msg="{caster} scans your mind.",
+          room_msg="{caster} scans {target}'s mind!",
+          no_target_msg="You need a target for mind scan."),
+)
+
+
+def get_spell(name):
+    """Get the `Spell` called name, or None"""
+    return SPELLS.get(name)
@@ -0,0 +1,241 @@
+"""
+Compact stat block for Ashfall MUD characters
+
+The numeric core of a character, the fields of `rules.STARTING_STATS`,
+is kept in one `StatBlock`, available as `character.stats`, instead of
+one Attribute per stat. In memory the values live in a flat list behind
+generated properties; in the database they are one Attribute,
+`statblock`, holding a dict of field -> value. Reading a stat never
+touches the database and changing one rewrites that single row.
+
+The hot fields in `HOT_FIELDS`, which change many times a minute in
+combat and regeneration, are written behind: changing one only marks the
+block dirty, and the `STAT_WRITER` flushes all dirty blocks in one
+transaction every `STAT_FLUSH_INTERVAL` seconds, which bounds how much
+progress a crash can lose. Blocks are also flushed on logout and before
+the server stops or reloads. Changing any other field writes the whole
+block at once, hot fields included. The in-memory block is authoritative;
+don't read the `statblock` Attribute directly.
+
+Any other name is passed through to the character's `db`, so a stat
+block can be handed to every rule in `world.rules` as the character's
+stat record.
+
+Multi-step changes such as leveling or remorting run inside
+`mutation()`, which stages every change, stats and passed-through
+Attributes alike, in memory and commits them in one transaction at the
+end. If anything fails partway, nothing is written and the in-memory
+stats are rolled back.
+
+Characters created before the stat block existed are migrated the first
+time it is loaded: their per-stat Attributes are folded into it and
+deleted.
+"""
+
+from contextlib import contextmanager
+
+from django.conf import settings
+from evennia.utils import logger
+
+from world.rules import STARTING_STATS
+from world.ticker import TickerService
+
+FIELDS = tuple(STARTING_STATS)
+_FIELD_SET = frozenset(FIELDS)
+HOT_FIELDS = frozenset(('hit_points', 'mana', 'move', 'experience'))
+ATTRIBUTE = 'statblock'
+
+
+class StatBlock:
+    """Numeric stats of one character, persisted as a single Attribute"""
+
+    __slots__ = ('_obj', '_values', '_dirty', '_staged')
+
+    def __init__(self, obj):
+        object.__setattr__(self, '_obj', obj)
+        object.__setattr__(self, '_dirty', False)
+        # Attribute name -> value staged by an open mutation, else None
+        object.__setattr__(self, '_staged', None)
+        stored = obj.attributes.get(ATTRIBUTE, default=None)
+        if stored is None:
+            stored = self._migrate()
+        object.__setattr__(self, '_values',
+                           [stored.get(field, STARTING_STATS[field]) for field in FIELDS])
+
+    def _migrate(self):
+        """Fold legacy per-stat Attributes into the block, if there are any"""
+        attributes = self._obj.attributes
+        stored = {}
+        for field in FIELDS:
+            value = attributes.get(field, default=None)
+            if value is not None:
+                stored[field] = value
+                attributes.remove(field)
+        if stored:
+            stored = {field: stored.get(field, STARTING_STATS[field]) for field in FIELDS}
+            attributes.add(ATTRIBUTE, stored)
+        return stored
+
+    def __getattr__(self, name):
+        staged = self._staged
+        if staged and name in staged:
+            return staged[name]
+        return getattr(self._obj.db, name)
+
+    def __setattr__(self, name, value):
+        if name in _FIELD_SET:
+            object.__setattr__(self, name, value)
+        elif self._staged is not None:
+            self._staged[name] = value
+        else:
+            setattr(self._obj.db, name, value)
+
+    def as_dict(self):
+        """Get every stat as a dict"""
+        return dict(zip(FIELDS, self._values))
+
+    def update(self, **stats):
+        """Set several stats with at most a single write"""
+        for name, value in stats.items():
+            self._values[FIELDS.index(name)] = value
+        if self._staged is not None:
+            return
+        if HOT_FIELDS.issuperset(stats):
+            self._mark_dirty()
+        else:
+            self.save()
+
+    def reset(self):
+        """Set every stat to its starting value"""
+        self.update(**STARTING_STATS)
+
+    @contextmanager
+    def mutation(self):
+        """
+        Stage every change made in the block and commit them atomically.
+
+        Nested mutations join the outermost one.
+
+        Raises:
+            Any error raised inside the block, after rolling back.
+        """
+        if self._staged is not None:
+            yield self
+            return
+        from django.db import transaction
+        snapshot = list(self._values), self._dirty
+        object.__setattr__(self, '_staged', {})
+        try:
+            yield self
+            with transaction.atomic():
+                self._obj.attributes.batch_add((ATTRIBUTE, self.as_dict()),
+                                               *self._staged.items())
+        except BaseException:
+            object.__setattr__(self, '_values', snapshot[0])
+            object.__setattr__(self, '_dirty', snapshot[1])
+            raise
+        finally:
+            object.__setattr__(self, '_staged', None)
+        object.__setattr__(self, '_dirty', False)
+        STAT_WRITER.discard(self)
+
+    def save(self):
+        """Write the block to its Attribute now"""
+        self._write()
+        object.__setattr__(self, '_dirty', False)
+        STAT_WRITER.discard(self)
+
+    def flush(self):
+        """Write the block if it has unsaved changes"""
+        if self._dirty:
+            self.save()
+
+    def _mark_dirty(self):
+        if not self._dirty:
+            object.__setattr__(self, '_dirty', True)
+            STAT_WRITER.add(self)
+
+    def _write(self):
+        self._obj.attributes.add(ATTRIBUTE, self.as_dict())
+
+
+def _stat_property(index, field):
+    def fget(self):
+        return self._values[index]
+
+    if field in HOT_FIELDS:
+        def fset(self, value):
+            self._values[index] = value
+            if self._staged is None:
+                self._mark_dirty()
+    else:
+        def fset(self, value):
+            self._values[index] = value
+            if self._staged is None:
+                self.save()
+
+    return property(fget, fset, doc=f"The character's {field.replace('_', ' ')}")
+
+
+for _index, _field in enumerate(FIELDS):
+    setattr(StatBlock, _field, _stat_property(_index, _field))
+del _index, _field
+
+
+class StatWriter(TickerService):
+    """
+    Dirty stat blocks waiting to be flushed.
+
+    The flush ticker is only subscribed while there is something to flush.
+    """
+
+    idstring = "stat_flush"
+
+    def __init__(self):
+        super().__init__()
+        self.blocks = set()
+
+    def get_interval(self):
+        """Get the flush interval, the most seconds of changes a crash can lose"""
+        return getattr(settings, 'STAT_FLUSH_INTERVAL', 5)
+
+    def get_callback(self):
+        return flush_stats
+
+    def has_work(self):
+        return bool(self.blocks)
+
+    def add(self, block):
+        """Queue a dirty block"""
+        self.blocks.add(block)
+        self.update_ticker()
+
+    def discard(self, block):
+        """Drop a block that was written some other way"""
+        self.blocks.discard(block)
+
+    def flush(self):
+        """Write every dirty block in one transaction"""
+        from django.db import transaction
+        blocks = [block for block in self.blocks if block._obj.pk]
+        self.blocks.clear()
+        if blocks:
+            try:
+                with transaction.atomic():
+                    for block in blocks:
+                        block._write()
+            except Exception:
+                logger.log_trace("Flushing character stats failed.")
+                self.blocks.update(blocks)
+            else:
+                for block in blocks:
+                    object.__setattr__(block, '_dirty', False)
+        self.update_ticker()
+
+
+STAT_WRITER = StatWriter()
+
+
+def flush_stats():
+    """Write every dirty stat block; ticker callback and shutdown hook"""
+    STAT_WRITER.flush()
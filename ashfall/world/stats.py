@@ -0,0 +1,97 @@
+"""
+Derived combat stats for Ashfall MUD
+
+A character's effective combat numbers combine its base stats, the items
+it has equipped and the modifiers of its active effects. The
+`DerivedStatsHandler`, available as `character.derived`, computes them
+into one read-only `DerivedStats` record and keeps it until something it
+depends on changes and marks it dirty: wielding, wearing or removing
+equipment, leveling, remorting, choosing a class, or an effect starting
+or ending. Combat reads the cached record on every swing.
+
+Equipment contributes:
+
+    weapon (wield slot) - damage_roll, hit_bonus, damage_bonus
+    every other item    - armor_bonus, radiation_protection
+
+This module has no Evennia dependencies.
+"""
+
+from dataclasses import dataclass
+
+from world import rules
+from world.dice import DiceExpression
+
+
+@dataclass(frozen=True, slots=True)
+class DerivedStats:
+    """Effective combat stats of a character"""
+
+    armor_class: int
+    hit_bonus: int
+    damage_bonus: int
+    strength: int
+    damage_dice: DiceExpression
+    radiation_protection: int
+
+    @property
+    def attack(self):
+        """(hit_bonus, damage_dice, damage_bonus, strength) for `rules.resolve_attack`"""
+        return self.hit_bonus, self.damage_dice, self.damage_bonus, self.strength
+
+
+def derive_stats(record, equipment, modifiers):
+    """
+    Compute effective stats.
+
+    Args:
+        record: Base stats with attribute access, such as a `db` handler.
+        equipment: An `EquipmentHandler`, or anything with its `weapon`
+            and `get_bonus`.
+        modifiers (dict): Stat -> summed modifier of active effects.
+
+    Returns:
+        DerivedStats
+    """
+    armor_class = (record.armor_class or 0) + modifiers.get('armor_class', 0)
+    hit_bonus = (record.hit_bonus or 0) + modifiers.get('hit_bonus', 0)
+    damage_bonus = (record.damage_bonus or 0) + modifiers.get('damage_bonus', 0)
+    radiation_protection = modifiers.get('radiation_protection', 0)
+    damage_dice = rules.UNARMED_DAMAGE
+
+    weapon = equipment.weapon
+    if weapon:
+        damage_dice = weapon.damage_roll
+        hit_bonus += weapon.db.hit_bonus or 0
+        damage_bonus += weapon.db.damage_bonus or 0
+    armor_class += equipment.get_bonus('armor_bonus')
+    radiation_protection += equipment.get_bonus('radiation_protection')
+
+    return DerivedStats(
+        armor_class=armor_class,
+        hit_bonus=hit_bonus,
+        damage_bonus=damage_bonus,
+        strength=(record.strength or 10) + modifiers.get('strength', 0),
+        damage_dice=damage_dice,
+        radiation_protection=radiation_protection,
+    )
+
+
+class DerivedStatsHandler:
+    """Memoized `DerivedStats` of one character"""
+
+    def __init__(self, obj):
+        self.obj = obj
+        self._stats = None
+
+    @property
+    def stats(self):
+        """The cached `DerivedStats`, recomputed first if dirty"""
+        if self._stats is None:
+            self._stats = derive_stats(self.obj.stats, self.obj.equipment,
+                                       self.obj.effects.modifiers)
+        return self._stats
+
+    def invalidate(self):
+        """Mark the cached stats dirty"""
+        self._stats = None
@@ -0,0 +1,62 @@
+"""
+Ticker services for Ashfall MUD
+
+The combat engine, regeneration, the stat writer and the zone resets all
+keep their work in memory and process all of it on one shared ticker
+that is only subscribed while there is work to do. `TickerService` is
+that common part.
+"""
+
+
+class TickerService:
+    """
+    A service run by one non-persistent ticker, subscribed only while
+    `has_work()` is true.
+
+    Subclasses set `idstring` and implement `get_interval`, `has_work` and
+    `get_callback`, which returns the module-level function the ticker
+    calls.
+    """
+
+    idstring = None
+
+    def __init__(self):
+        # interval of the subscribed ticker, None while it is not running
+        self.interval = None
+
+    def get_interval(self):
+        """Get the ticker interval in seconds"""
+        raise NotImplementedError
+
+    def get_callback(self):
+        """Get the function the ticker calls"""
+        raise NotImplementedError
+
+    def has_work(self):
+        """Check if the ticker needs to run"""
+        raise NotImplementedError
+
+    def update_ticker(self):
+        """Subscribe the ticker if there is work, unsubscribe it if not"""
+        if self.has_work():
+            self._start()
+        else:
+            self._stop()
+
+    def _start(self):
+        """Subscribe the ticker if it is not already running"""
+        if self.interval is not None:
+            return
+        from evennia import TICKER_HANDLER
+        self.interval = self.get_interval()
+        TICKER_HANDLER.add(self.interval, self.get_callback(), idstring=self.idstring,
+                           persistent=False)
+
+    def _stop(self):
+        """Unsubscribe the ticker"""
+        if self.interval is None:
+            return
+        from evennia import TICKER_HANDLER
+        TICKER_HANDLER.remove(self.interval, self.get_callback(), idstring=self.idstring,
+                              persistent=False)
+        self.interval = None
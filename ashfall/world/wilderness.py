@@ -0,0 +1,301 @@
+"""
+Wilderness for Ashfall MUD
+
+The wasteland around the hand-built zones is an (x, y) grid of tiles.
+The terrain of a tile comes from a seeded noise function, so tiles are
+never stored. Only occupied tiles have a room: the `WILDERNESS` lends
+`WildernessRoom` objects from a small pool to the tiles characters walk
+onto and takes them back once the tiles are empty again.
+
+Gateways are ordinary rooms of a zone file with the `WildernessRoom`
+typeclass and fixed coordinates. They are never pooled, and link the
+grid to the rest of the world through normal exits:
+
+    {"id": "outskirts", "key": "Outskirts",
+     "typeclass": "typeclasses.rooms.WildernessRoom",
+     "attributes": {"coordinates": [500, 500]}}
+
+Inside the grid characters move through virtual exits, one per compass
+direction with a passable tile, so tiles cost no exit rows either. North
+is +y and east is +x.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+
+from django.conf import settings
+
+from world.navigation import ExitIndex, normalize_direction
+
+POOL_TAG = "pooled"
+TAG_CATEGORY = "wilderness"
+ROOM_TYPECLASS = "typeclasses.rooms.WildernessRoom"
+
+# compass direction -> (dx, dy)
+OFFSETS = {
+    'north': (0, 1),
+    'south': (0, -1),
+    'east': (1, 0),
+    'west': (-1, 0),
+    'northeast': (1, 1),
+    'northwest': (-1, 1),
+    'southeast': (1, -1),
+    'southwest': (-1, -1),
+}
+
+
+@dataclass(frozen=True)
+class Terrain:
+    """A kind of wilderness tile"""
+
+    key: str
+    name: str
+    desc: str
+    passable: bool = True
+
+
+TERRAINS = MappingProxyType({terrain.key: terrain for terrain in (
+    Terrain('glassed_crater', "Glassed Crater",
+            "The ground here was fused into black glass by the blast, and still\n"
+            "ticks with heat. Nothing could cross it and live.", passable=False),
+    Terrain('ash_dunes', "Ash Dunes",
+            "Grey dunes of ash roll away in every direction, shifting with each\n"
+            "gust of wind. Your feet sink to the ankle with every step."),
+    Terrain('cracked_flats', "Cracked Flats",
+            "A dry plain of cracked earth stretches to the horizon, broken only\n"
+            "by the bleached bones of long dead cattle."),
+    Terrain('dead_forest', "Dead Forest",
+            "Blackened tree trunks stand in silent rows, their branches stripped\n"
+            "bare. Ash crunches underfoot and nothing sings."),
+    Terrain('rubble_field', "Rubble Field",
+            "Heaps of broken concrete and twisted rebar mark where a town once\n"
+            "stood. Scavengers have picked most of it clean."),
+)})
+
+# (upper bound of the noise value, terrain key), by rising value
+TERRAIN_BANDS = (
+    (0.3, 'glassed_crater'),
+    (0.45, 'ash_dunes'),
+    (0.58, 'cracked_flats'),
+    (0.7, 'dead_forest'),
+    (1.0, 'rubble_field'),
+)
+# tiles between noise lattice points, and the weight of each octave
+NOISE_OCTAVES = ((16, 0.7), (4, 0.3))
+
+
+def _lattice(seed, octave, x, y):
+    """Random value in [0, 1) for one noise lattice point"""
+    digest = hashlib.blake2b(f"{seed}:{octave}:{x}:{y}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'big') / 2 ** 64
+
+
+def _fade(t):
+    return t * t * (3 - 2 * t)
+
+
+def _value_noise(seed, octave, x, y, scale):
+    """Lattice values every scale tiles, smoothly interpolated in between"""
+    cell_x, offset_x = divmod(x, scale)
+    cell_y, offset_y = divmod(y, scale)
+    tx, ty = _fade(offset_x / scale), _fade(offset_y / scale)
+    low = _lattice(seed, octave, cell_x, cell_y)
+    low += (_lattice(seed, octave, cell_x + 1, cell_y) - low) * tx
+    high = _lattice(seed, octave, cell_x, cell_y + 1)
+    high += (_lattice(seed, octave, cell_x + 1, cell_y + 1) - high) * tx
+    return low + (high - low) * ty
+
+
+@lru_cache(maxsize=65536)
+def terrain_at(x, y, seed=0):
+    """Get the `Terrain` of tile (x, y); a seed always gives the same map"""
+    value = sum(weight * _value_noise(seed, octave, x, y, scale)
+                for octave, (scale, weight) in enumerate(NOISE_OCTAVES))
+    for bound, key in TERRAIN_BANDS:
+        if value < bound:
+            return TERRAINS[key]
+    return TERRAINS[TERRAIN_BANDS[-1][1]]
+
+
+class VirtualExit:
+    """
+    The way from a wilderness tile to the next, usable by movement code
+    like an exit object. Its destination room is only taken from the
+    pool by `at_traverse`, and given back if the move fails.
+    """
+
+    def __init__(self, direction, coordinates):
+        self.key = direction
+        self.coordinates = coordinates
+
+    @property
+    def destination(self):
+        """The room of the tile if someone is there, else None"""
+        return WILDERNESS.find_room(self.coordinates)
+
+    def at_traverse(self, traversing_object, target_location=None, **kwargs):
+        """
+        Move traversing_object onto the tile, lending the tile a room.
+        Keyword arguments are passed on to `move_to`.
+
+        Returns:
+            bool: If the move succeeded.
+        """
+        kwargs.setdefault('move_type', "traverse")
+        room = WILDERNESS.room_at(self.coordinates)
+        if traversing_object.move_to(room, **kwargs):
+            return True
+        WILDERNESS.release(room)
+        return False
+
+    @property
+    def destination_name(self):
+        """Name of the tile the exit leads to"""
+        return WILDERNESS.tile_name(self.coordinates)
+
+
+class WildernessExits:
+    """Exit lookup of a wilderness room: its real exits, then the compass"""
+
+    def __init__(self, room):
+        self.room = room
+        self.index = ExitIndex(room)
+
+    def get(self, name):
+        """Get the exit called name, or the virtual exit in that direction"""
+        exit = self.index.get(name)
+        if exit is not None:
+            return exit
+        direction = normalize_direction(name)
+        target = WILDERNESS.step(self.room.coordinates, direction)
+        return VirtualExit(direction, target) if target else None
+
+    def directions(self):
+        """Get the compass directions leading to passable tiles, past the real exits"""
+        return [direction for direction in OFFSETS
+                if self.index.get(direction) is None
+                and WILDERNESS.step(self.room.coordinates, direction)]
+
+    def invalidate(self):
+        """Drop the index of real exits"""
+        self.index.invalidate()
+
+
+class Wilderness:
+    """
+    Tile -> room map of the occupied wilderness, and the pool of spare
+    rooms lent to tiles.
+    """
+
+    def __init__(self):
+        # (x, y) -> room, for gateways and occupied tiles
+        self.rooms = None
+        self.gateways = set()
+        self.pool = []
+
+    def get_seed(self):
+        """Get the seed of the terrain"""
+        return getattr(settings, 'WILDERNESS_SEED', 0)
+
+    def get_size(self):
+        """Get the (width, height) of the grid in tiles"""
+        return getattr(settings, 'WILDERNESS_SIZE', (1000, 1000))
+
+    def get_pool_size(self):
+        """Get the most spare rooms kept for reuse"""
+        return getattr(settings, 'WILDERNESS_POOL_SIZE', 20)
+
+    def load(self):
+        """Find the gateways, occupied tiles and spare rooms"""
+        from evennia.objects.models import ObjectDB
+        pooled = set(ObjectDB.objects.filter(
+            db_typeclass_path=ROOM_TYPECLASS, db_tags__db_key=POOL_TAG,
+            db_tags__db_category=TAG_CATEGORY).values_list('id', flat=True))
+        self.rooms, self.gateways, self.pool = {}, set(), []
+        for room in ObjectDB.objects.filter(db_typeclass_path=ROOM_TYPECLASS):
+            coordinates = room.coordinates
+            if room.id not in pooled:
+                if coordinates:
+                    self.rooms[coordinates] = room
+                    self.gateways.add(coordinates)
+            elif coordinates and room.contents and coordinates not in self.rooms:
+                self.rooms[coordinates] = room
+            elif not room.contents:
+                self.pool.append(room)
+
+    def terrain(self, coordinates):
+        """Get the terrain of a tile"""
+        return terrain_at(*coordinates, seed=self.get_seed())
+
+    def tile_name(self, coordinates):
+        """Get what a tile is called, without giving it a room"""
+        if self.rooms is None:
+            self.load()
+        room = self.rooms.get(coordinates)
+        return room.key if room else self.terrain(coordinates).name
+
+    def step(self, coordinates, direction):
+        """
+        Get the tile one step from coordinates in direction.
+
+        Returns:
+            tuple: The (x, y) of the tile, or None if it is off the map,
+                impassable or direction is not a compass direction.
+        """
+        if not coordinates or direction not in OFFSETS:
+            return None
+        if self.rooms is None:
+            self.load()
+        dx, dy = OFFSETS[direction]
+        x, y = coordinates[0] + dx, coordinates[1] + dy
+        width, height = self.get_size()
+        if not (0 <= x < width and 0 <= y < height):
+            return None
+        if (x, y) in self.gateways or self.terrain((x, y)).passable:
+            return (x, y)
+        return None
+
+    def find_room(self, coordinates):
+        """Get the room of a tile, or None if it has none"""
+        if self.rooms is None:
+            self.load()
+        return self.rooms.get(coordinates)
+
+    def room_at(self, coordinates):
+        """Get the room of a tile, lending it a spare room if it has none"""
+        if self.rooms is None:
+            self.load()
+        room = self.rooms.get(coordinates)
+        if room is not None:
+            return room
+        # a pooled room can have gained contents behind the pool's back
+        while self.pool:
+            room = self.pool.pop()
+            if room.pk and not room.contents:
+                break
+        else:
+            from evennia.utils.create import create_object
+            room = create_object(ROOM_TYPECLASS, key="wilderness", nohome=True,
+                                 tags=[(POOL_TAG, TAG_CATEGORY)])
+        room.key = self.terrain(coordinates).name
+        room.db.coordinates = coordinates
+        self.rooms[coordinates] = room
+        return room
+
+    def release(self, room):
+        """Take the room of a tile back into the pool once nothing is in it"""
+        if self.rooms is None or not room.pk or room.contents:
+            return
+        coordinates = room.coordinates
+        if coordinates in self.gateways or self.rooms.get(coordinates) is not room:
+            return
+        del self.rooms[coordinates]
+        if len(self.pool) < self.get_pool_size():
+            self.pool.append(room)
+        else:
+            room.delete()
+
+
+WILDERNESS = Wilderness()
@@ -0,0 +1,628 @@
+"""
+Zone files for Ashfall MUD
+
+Every zone is one JSON file in `world/zones/`, named after the zone:
+
+    {
+        "zone": "ashfall",
+        "respawn": "<room id>",             zone respawn point, optional
+        "default_respawn": "<room id>",     default respawn point, optional
+        "rooms": [{"id", "key", "aliases", "desc"}],
+        "exits": [{"from", "to", "key", "aliases", "two_way"}],
+        "items": [{"id", "typeclass", "key", "aliases", "location"}],
+        "spawns": [{"id", "typeclass", "key", "aliases", "location", "count",
+                    "interval"}]
+    }
+
+Ids are local to the zone. Exits and locations name rooms by id, or a
+room of another, already loaded zone as "<zone>:<id>". Exits named after
+a direction get its aliases by default, and `two_way` also creates the
+exit back. Any entry may set `typeclass` and extra `attributes`; items
+and spawns may name a prototype of `world.prototypes` instead of a
+typeclass and key, and are then spawned by `world.spawner`.
+
+Items are placed once. Spawns are restocked by the zone resets in
+`world.resets`, up to `count` in their location, every `interval`
+seconds.
+
+Every object is tagged with its uid, "<zone>:<id>", in the "zone_uid"
+category, and rooms with their zone name in the "zone" category. Loading
+finds every existing uid of the zone in one query and creates only what
+is missing, in one transaction, so loading a zone again is safe and
+picks up what was added to the file. Spawns are topped up to their count.
+Untagged objects matching an entry by typeclass, key, location and
+destination, as left by the hand-built world, are adopted instead of
+duplicated; prototype entries match by the prototype's key and
+typeclass, or the item typeclass used before prototypes. Legacy exits
+between the same rooms as a zone exit are renamed after it, or deleted
+if the zone exit already exists.
+
+Loading never changes what exists. To push edits of a zone file to a
+running server, `ZoneSync` compares the content hash of every entry with
+the one stored on its objects and creates, updates and deletes only what
+differs. Objects remember which Attributes their entry set, so
+Attributes removed from the file are removed from the objects too.
+"""
+
+import hashlib
+import json
+import os
+
+from world.navigation import (DIRECTIONS, ROOM_GRAPH, invalidate_exits, normalize_direction,
+                              reverse_direction)
+from world.respawn import RESPAWN_REGISTRY, ZONE_TAG_CATEGORY
+from world.spawner import get_prototype, spawn
+
+ZONE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "zones")
+UID_TAG_CATEGORY = "zone_uid"
+HASH_TAG_CATEGORY = "zone_hash"
+ROOM_TYPECLASS = "typeclasses.rooms.Room"
+EXIT_TYPECLASS = "typeclasses.exits.Exit"
+SECTIONS = ('rooms', 'exits', 'items', 'spawns')
+SETTINGS = ('zone', 'respawn', 'default_respawn')
+# entry fields that say how many objects there are and when, not what they are
+UNHASHED = ('count', 'interval', 'hash')
+# prototype key -> item typeclass the hand-built world used instead
+LEGACY_TYPECLASSES = {
+    'rusty_pipe': "typeclasses.items.RustyPipe",
+    'scrap_metal_club': "typeclasses.items.ScrapMetalClub",
+    'salvaged_rifle': "typeclasses.items.SalvagedRifle",
+    'laser_pistol': "typeclasses.items.LaserPistol",
+    'leather_duster': "typeclasses.items.LeatherDuster",
+    'scrap_metal_armor': "typeclasses.items.ScrapMetalArmor",
+    'radiation_suit': "typeclasses.items.RadiationSuit",
+    'combat_helmet': "typeclasses.items.CombatHelmet",
+    'water_canteen': "typeclasses.items.WaterCanteen",
+    'medkit': "typeclasses.items.Medkit",
+    'rad_away': "typeclasses.items.RadAway",
+    'energy_cell': "typeclasses.items.EnergyCell",
+}
+# Attribute listing the Attributes the zone file set, so a sync can remove
+# the ones dropped from the file
+FILE_ATTRIBUTES = "zone_attributes"
+
+
+def zone_names():
+    """Get the name of every zone file, sorted"""
+    return sorted(name[:-5] for name in os.listdir(ZONE_DIR) if name.endswith(".json"))
+
+
+def read_zone(name):
+    """
+    Read and check the zone file called name.
+
+    Raises:
+        ValueError: If there is no such zone or the file is malformed.
+    """
+    path = os.path.join(ZONE_DIR, f"{name}.json")
+    if not os.path.isfile(path):
+        raise ValueError(f"There is no zone file called '{name}'.")
+    with open(path, encoding="utf-8") as handle:
+        try:
+            data = json.load(handle)
+        except json.JSONDecodeError as err:
+            raise ValueError(f"Zone file '{name}' is not valid JSON: {err}") from err
+    return parse_zone(data)
+
+
+def _require(entry, field, what):
+    value = entry.get(field)
+    if not value:
+        raise ValueError(f"{what} is missing '{field}'.")
+    if field == 'id' and ':' in str(value):
+        raise ValueError(f"{what} uses ':' in its id '{value}'.")
+    return str(value).lower() if field in ('id', 'from', 'to', 'location') else value
+
+
+def content_hash(entry):
+    """Hash what the objects of entry look like, but not how many there are"""
+    content = {field: value for field, value in entry.items() if field not in UNHASHED}
+    return hashlib.sha1(json.dumps(content, sort_keys=True).encode()).hexdigest()
+
+
+def parse_zone(data):
+    """
+    Check zone data and flatten it into the objects to create.
+
+    Returns:
+        tuple: (zone, settings, entries), where entries maps local id to
+            the create_object arguments of that object, rooms first.
+
+    Raises:
+        ValueError: If the data is malformed or refers to unknown rooms.
+    """
+    zone = str(data.get('zone') or '').lower()
+    if not zone or ':' in zone:
+        raise ValueError("A zone needs a 'zone' name without ':'.")
+    unknown = set(data) - set(SECTIONS) - set(SETTINGS)
+    if unknown:
+        raise ValueError(f"Zone '{zone}' has unknown sections: {', '.join(sorted(unknown))}.")
+
+    entries = {}
+    rooms = set()
+
+    def add(local_id, **entry):
+        if local_id in entries:
+            raise ValueError(f"Zone '{zone}' defines '{local_id}' twice.")
+        entry['hash'] = content_hash(entry)
+        entries[local_id] = entry
+
+    def room(ref, what):
+        if ':' not in ref and ref not in rooms:
+            raise ValueError(f"Zone '{zone}': {what} refers to unknown room '{ref}'.")
+        return ref
+
+    for spec in data.get('rooms', ()):
+        local_id = _require(spec, 'id', f"A room of zone '{zone}'")
+        attributes = dict(spec.get('attributes', {}), desc=spec.get('desc', ''))
+        add(local_id, typeclass=spec.get('typeclass', ROOM_TYPECLASS),
+            key=_require(spec, 'key', f"Room '{local_id}'"), aliases=spec.get('aliases', []),
+            attributes=attributes, room=True)
+        rooms.add(local_id)
+
+    for spec in data.get('exits', ()):
+        what = f"An exit of zone '{zone}'"
+        source, destination = _require(spec, 'from', what), _require(spec, 'to', what)
+        key = _require(spec, 'key', what)
+        ways = [(source, destination, key, spec.get('aliases'))]
+        if spec.get('two_way'):
+            back = reverse_direction(key)
+            if not back:
+                raise ValueError(f"Zone '{zone}': the two-way exit '{key}' is not a direction.")
+            ways.append((destination, source, back, None))
+        for source, destination, key, aliases in ways:
+            direction = normalize_direction(key)
+            if aliases is None:
+                aliases = list(DIRECTIONS[direction][0]) if direction else []
+            add(f"{source}/{direction or key.lower()}",
+                typeclass=spec.get('typeclass', EXIT_TYPECLASS), key=direction or key,
+                aliases=aliases, attributes=spec.get('attributes', {}),
+                location=room(source, f"exit '{key}'"),
+                destination=room(destination, f"exit '{key}'"))
+
+    for section in ('items', 'spawns'):
+        for spec in data.get(section, ()):
+            local_id = _require(spec, 'id', f"An entry in the {section} of zone '{zone}'")
+            what = f"'{local_id}' of zone '{zone}'"
+            count = spec.get('count', 1) if section == 'spawns' else 1
+            if not isinstance(count, int) or count < 1:
+                raise ValueError(f"Spawn {what} needs a positive count.")
+            entry = dict(aliases=spec.get('aliases', []), attributes=spec.get('attributes', {}),
+                         location=room(_require(spec, 'location', what), what), count=count)
+            if spec.get('prototype'):
+                try:
+                    get_prototype(spec['prototype'])
+                except ValueError as err:
+                    raise ValueError(f"Entry {what}: {err}") from None
+                entry['prototype'] = spec['prototype']
+            else:
+                entry.update(typeclass=_require(spec, 'typeclass', what),
+                             key=_require(spec, 'key', what))
+            if section == 'spawns':
+                interval = spec.get('interval')
+                if interval is not None and (not isinstance(interval, (int, float))
+                                             or interval <= 0):
+                    raise ValueError(f"Spawn {what} needs a positive interval.")
+                entry['interval'] = interval
+            add(local_id, **entry)
+
+    settings = {}
+    for setting in ('respawn', 'default_respawn'):
+        if data.get(setting):
+            settings[setting] = room(str(data[setting]).lower(), f"'{setting}'")
+    return zone, settings, entries
+
+
+def _find_uids(uids=None, prefix=None):
+    """Map uid -> [object id, ...] for the given uids, or every uid starting with prefix"""
+    from evennia.objects.models import ObjectDB
+    if uids is not None:
+        query = ObjectDB.objects.filter(db_tags__db_category=UID_TAG_CATEGORY,
+                                        db_tags__db_key__in=uids)
+    else:
+        query = ObjectDB.objects.filter(db_tags__db_category=UID_TAG_CATEGORY,
+                                        db_tags__db_key__startswith=prefix)
+    found = {}
+    for dbid, uid in query.values_list('id', 'db_tags__db_key'):
+        found.setdefault(uid, []).append(dbid)
+    return found
+
+
+def _legacy_identity(entry):
+    """
+    Get the typeclass paths and the key objects of entry were created
+    with by the hand-built world. For prototype entries these are the
+    prototype's own and its item's typeclass from before prototypes.
+    """
+    if 'prototype' not in entry:
+        return (entry['typeclass'],), entry['key']
+    prototype = get_prototype(entry['prototype'])
+    legacy = LEGACY_TYPECLASSES.get(prototype['prototype_key'])
+    return (prototype['typeclass'],) + ((legacy,) if legacy else ()), prototype['key']
+
+
+def _adopt_legacy(zone, entries, existing, rooms):
+    """
+    Tag untagged objects that match missing entries by typeclass, key,
+    location and destination, so a world built before zone files is not
+    built twice. Legacy exits linking the same rooms as a missing exit
+    under another name are adopted and renamed.
+    """
+    from evennia.objects.models import ObjectDB
+    prefix = f"{zone}:"
+    # rooms first, so the rest can be matched by location
+    for want_rooms in (True, False):
+        missing = {local_id: entry for local_id, entry in entries.items()
+                   if bool(entry.get('room')) == want_rooms
+                   and prefix + local_id not in existing}
+        if not missing:
+            continue
+        identities = {local_id: _legacy_identity(entry) for local_id, entry in missing.items()}
+        candidates = ObjectDB.objects.filter(
+            db_key__in={key for _, key in identities.values()},
+            db_typeclass_path__in={path for paths, _ in identities.values() for path in paths},
+        ).exclude(db_tags__db_category=UID_TAG_CATEGORY)
+        pool = {}
+        for obj in candidates:
+            pool.setdefault((obj.db_key, obj.db_location_id, obj.db_destination_id),
+                            []).append(obj)
+        for local_id, entry in missing.items():
+            typeclasses, key = identities[local_id]
+            location = rooms.get(entry.get('location'))
+            destination = rooms.get(entry.get('destination'))
+            found = pool.get((key, location and location.id, destination and destination.id), [])
+            matches = [obj for obj in found if obj.db_typeclass_path in typeclasses]
+            while matches and len(existing.get(prefix + local_id, ())) < entry.get('count', 1):
+                obj = matches.pop()
+                found.remove(obj)
+                obj.tags.add(prefix + local_id, category=UID_TAG_CATEGORY)
+                existing.setdefault(prefix + local_id, []).append(obj.id)
+                if want_rooms:
+                    # a room belongs to one zone only
+                    obj.tags.remove(category=ZONE_TAG_CATEGORY)
+                    obj.tags.add(zone, category=ZONE_TAG_CATEGORY)
+                    rooms[local_id] = obj
+    _retarget_legacy_exits(zone, entries, existing, rooms)
+    _delete_legacy_exits(existing, rooms)
+
+
+def _retarget_legacy_exits(zone, entries, existing, rooms):
+    """
+    Adopt untagged exits that link the same two rooms as a missing exit
+    entry under another name, and rename them after the entry. The
+    hand-built world led east from the City Ruins to the bunker, where
+    the zone file goes down.
+    """
+    from evennia.objects.models import ObjectDB
+    prefix = f"{zone}:"
+    links = {}
+    for local_id, entry in entries.items():
+        location = rooms.get(entry.get('location'))
+        destination = rooms.get(entry.get('destination'))
+        if location and destination and prefix + local_id not in existing:
+            links[(location.id, destination.id)] = (local_id, entry)
+    if not links:
+        return
+    candidates = ObjectDB.objects.filter(
+        db_typeclass_path__in={entry['typeclass'] for _, entry in links.values()},
+        db_location_id__in={location for location, _ in links},
+        db_destination_id__in={destination for _, destination in links},
+    ).exclude(db_tags__db_category=UID_TAG_CATEGORY)
+    for obj in candidates:
+        link = (obj.db_location_id, obj.db_destination_id)
+        if link not in links or obj.db_typeclass_path != links[link][1]['typeclass']:
+            continue
+        local_id, entry = links.pop(link)
+        obj.tags.add(prefix + local_id, category=UID_TAG_CATEGORY)
+        existing.setdefault(prefix + local_id, []).append(obj.id)
+        obj.key = entry['key']
+        obj.aliases.clear()
+        obj.aliases.batch_add(*entry['aliases'])
+        invalidate_exits(obj.location)
+
+
+def _delete_legacy_exits(existing, rooms):
+    """
+    Delete untagged direction exits that duplicate a zone exit between
+    the same two rooms, as left by the hand-built world in zones loaded
+    before legacy exits were retargeted.
+    """
+    from evennia.objects.models import ObjectDB
+    tagged = {dbid for dbids in existing.values() for dbid in dbids}
+    exits = ObjectDB.objects.filter(
+        db_location_id__in=[room.id for ref, room in rooms.items() if ':' not in ref],
+        db_destination__isnull=False)
+    links = {(location, destination) for dbid, location, destination in
+             exits.values_list('id', 'db_location_id', 'db_destination_id') if dbid in tagged}
+    legacy = exits.filter(db_typeclass_path=EXIT_TYPECLASS).exclude(
+        db_tags__db_category=UID_TAG_CATEGORY)
+    for obj in legacy:
+        if normalize_direction(obj.db_key) and (obj.db_location_id, obj.db_destination_id) in links:
+            obj.delete()
+
+
+def _room_refs(entries):
+    """Get every room the given entries are located in or lead to"""
+    return {ref for entry in entries
+            for ref in (entry.get('location'), entry.get('destination')) if ref}
+
+
+def _load_rooms(zone, existing, refs):
+    """
+    Get the room objects of refs, local room ids or "<zone>:<id>" refs
+    to rooms of other zones, in one query.
+
+    Raises:
+        ValueError: If a room of another zone is not loaded.
+    """
+    from evennia.objects.models import ObjectDB
+    foreign = {ref for ref in refs if ':' in ref}
+    room_ids = {ref: dbids[0] for ref, dbids in
+                (_find_uids(uids=foreign) if foreign else {}).items()}
+    missing = foreign - set(room_ids)
+    if missing:
+        raise ValueError(f"Zone '{zone}' refers to rooms that are not loaded: "
+                         f"{', '.join(sorted(missing))}.")
+    room_ids.update({ref: existing[f"{zone}:{ref}"][0] for ref in refs
+                     if ':' not in ref and f"{zone}:{ref}" in existing})
+    loaded = ObjectDB.objects.in_bulk(list(room_ids.values()))
+    return {ref: loaded[dbid] for ref, dbid in room_ids.items() if dbid in loaded}
+
+
+def _file_attributes(entry):
+    """Get the (name, value) Attributes entry sets, with the list of their names"""
+    attributes = list(entry['attributes'].items())
+    if attributes:
+        attributes.append((FILE_ATTRIBUTES, sorted(entry['attributes'])))
+    return attributes
+
+
+def create_entry(zone, local_id, entry, rooms):
+    """
+    Create one object of entry, from its prototype or its typeclass, and
+    add it to rooms if it is a room.
+    """
+    tags = [(f"{zone}:{local_id}", UID_TAG_CATEGORY), (entry['hash'], HASH_TAG_CATEGORY)]
+    if entry.get('room'):
+        tags.append((zone, ZONE_TAG_CATEGORY))
+    location = rooms.get(entry.get('location'))
+    if entry.get('prototype'):
+        overrides = {'location': location, 'tags': tags, 'attrs': _file_attributes(entry)}
+        if entry['aliases']:
+            overrides['aliases'] = entry['aliases']
+        obj = spawn(entry['prototype'], **overrides)[0]
+    else:
+        from evennia.utils.create import create_object
+        obj = create_object(entry['typeclass'], key=entry['key'], location=location,
+                            destination=rooms.get(entry.get('destination')),
+                            aliases=entry['aliases'], tags=tags,
+                            attributes=_file_attributes(entry))
+    if entry.get('room'):
+        rooms[local_id] = obj
+    return obj
+
+
+def find_rooms(zone, refs):
+    """
+    Get the room objects of refs, local room ids of zone or "<zone>:<id>"
+    refs to rooms of other zones. Rooms that no longer exist are left out.
+
+    Raises:
+        ValueError: If a room of another zone is not loaded.
+    """
+    local = {f"{zone}:{ref}" for ref in refs if ':' not in ref}
+    return _load_rooms(zone, _find_uids(uids=local) if local else {}, refs)
+
+
+def load_zone(name):
+    """
+    Create whatever is missing of the zone called name, in one transaction.
+
+    Returns:
+        tuple: (rooms, created), the rooms of the zone by local id and the
+            number of objects created.
+
+    Raises:
+        ValueError: If the zone file is malformed, or refers to a room of
+            a zone that is not loaded.
+    """
+    from django.db import transaction
+
+    zone, settings, entries = read_zone(name)
+    prefix = f"{zone}:"
+    created = 0
+    # exits are added to the room graph once, after the whole zone is in
+    with ROOM_GRAPH.batch(), transaction.atomic():
+        existing = _find_uids(prefix=prefix)
+        room_ids = {local_id for local_id, entry in entries.items() if entry.get('room')}
+        rooms = _load_rooms(zone, existing, room_ids | _room_refs(entries.values()))
+        _adopt_legacy(zone, entries, existing, rooms)
+
+        for local_id, entry in entries.items():
+            for _ in range(entry.get('count', 1) - len(existing.get(prefix + local_id, ()))):
+                create_entry(zone, local_id, entry, rooms)
+                created += 1
+
+    _set_respawn_points(zone, settings, rooms)
+    return {local_id: room for local_id, room in rooms.items() if ':' not in local_id}, created
+
+
+def _set_respawn_points(zone, settings, rooms):
+    """Set the respawn points of the zone file, unless they are already set"""
+    points = dict(RESPAWN_REGISTRY.points())
+    for setting, point in (('respawn', ('zone', zone)), ('default_respawn', ('default', ''))):
+        room = rooms.get(settings.get(setting))
+        if room and point not in points:
+            RESPAWN_REGISTRY.set(*point, room)
+
+
+def load_all_zones():
+    """
+    Load every zone file, in name order.
+
+    Returns:
+        int: The number of objects created.
+    """
+    return sum(load_zone(name)[1] for name in zone_names())
+
+
+def _find_hashes(prefix):
+    """Map object id -> content hash for every object whose uid starts with prefix"""
+    from evennia.objects.models import ObjectDB
+    rows = ObjectDB.db_tags.through.objects.filter(
+        tag__db_category=HASH_TAG_CATEGORY,
+        objectdb__db_tags__db_category=UID_TAG_CATEGORY,
+        objectdb__db_tags__db_key__startswith=prefix,
+    ).values_list('objectdb_id', 'tag__db_key')
+    return dict(rows)
+
+
+def _lies_in_room(obj):
+    """Check that obj is not carried by anyone"""
+    return obj.location is None or obj.location.location is None
+
+
+class ZoneSync:
+    """
+    The changes that bring the live objects of a zone in line with its
+    zone file.
+
+    Every object stores the content hash of its zone file entry as a tag,
+    so finding the changes costs two queries whatever the size of the
+    zone. Applying them only touches the objects that differ, a batch at
+    a time, each batch in its own transaction.
+
+    Players are left where they are: rooms with players in them are not
+    deleted, and items someone carries are neither moved nor deleted.
+    """
+
+    batch_size = 100
+
+    def __init__(self, name):
+        self.zone, self.settings, self.entries = read_zone(name)
+        prefix = f"{self.zone}:"
+        self.existing = _find_uids(prefix=prefix)
+        hashes = _find_hashes(prefix)
+        # local id -> number of objects to create
+        self.creates = {}
+        # (local id, object id) of objects whose entry changed
+        self.updates = []
+        # ids of objects no longer in the zone file, and of surplus spawns
+        self.deletes = []
+        # objects that were not deleted because of players, once applied
+        self.skipped = []
+
+        stale = dict(self.existing)
+        for local_id, entry in self.entries.items():
+            dbids = sorted(stale.pop(prefix + local_id, ()))
+            count = entry.get('count', 1)
+            if len(dbids) < count:
+                self.creates[local_id] = count - len(dbids)
+            self.updates.extend((local_id, dbid) for dbid in dbids[:count]
+                                if hashes.get(dbid) != entry['hash'])
+            self.deletes.extend(dbids[count:])
+        for dbids in stale.values():
+            self.deletes.extend(dbids)
+
+    def __bool__(self):
+        return bool(self.creates or self.updates or self.deletes)
+
+    def summary(self):
+        """Describe the changes in one line"""
+        return (f"Zone {self.zone}: {sum(self.creates.values())} to create, "
+                f"{len(self.updates)} to update, {len(self.deletes)} to delete.")
+
+    def batches(self):
+        """
+        Apply the changes, yielding the number of changes applied after
+        every batch so the server can run in between.
+
+        Raises:
+            ValueError: If the zone refers to a room of a zone that is not
+                loaded.
+        """
+        from django.db import transaction
+        from evennia.objects.models import ObjectDB
+
+        changed = [self.entries[local_id] for local_id in self.creates]
+        changed += [self.entries[local_id] for local_id, _ in self.updates]
+        rooms = _load_rooms(self.zone, self.existing,
+                            _room_refs(changed) | set(self.settings.values()))
+        steps = [('create', local_id, None)
+                 for local_id, count in self.creates.items() for _ in range(count)]
+        steps += [('update', local_id, dbid) for local_id, dbid in self.updates]
+        steps += [('delete', None, dbid) for dbid in self.deletes]
+
+        with ROOM_GRAPH.batch():
+            for start in range(0, len(steps), self.batch_size):
+                batch = steps[start:start + self.batch_size]
+                objects = ObjectDB.objects.in_bulk([dbid for _, _, dbid in batch if dbid])
+                with transaction.atomic():
+                    for action, local_id, dbid in batch:
+                        if action == 'create':
+                            create_entry(self.zone, local_id, self.entries[local_id], rooms)
+                        elif action == 'update' and dbid in objects:
+                            self._update(objects[dbid], self.entries[local_id], rooms)
+                        elif action == 'delete' and dbid in objects:
+                            self._delete(objects[dbid])
+                yield start + len(batch)
+        _set_respawn_points(self.zone, self.settings, rooms)
+
+    def apply(self):
+        """Apply every change at once"""
+        for _ in self.batches():
+            pass
+
+    def _update(self, obj, entry, rooms):
+        """Bring obj in line with entry, without moving its contents"""
+        # objects spawned from a prototype take their typeclass, key and
+        # aliases from it, unless the entry names aliases of its own
+        if 'typeclass' in entry and obj.typeclass_path != entry['typeclass']:
+            # keep the live state; creation hooks would reset it
+            obj.swap_typeclass(entry['typeclass'], clean_attributes=False, run_start_hooks=None)
+        if 'key' in entry and obj.key != entry['key']:
+            obj.key = entry['key']
+        aliases = sorted(alias.lower() for alias in entry['aliases'])
+        if (aliases or 'prototype' not in entry) and sorted(obj.aliases.all()) != aliases:
+            obj.aliases.clear()
+            obj.aliases.batch_add(*aliases)
+            if entry.get('destination'):
+                invalidate_exits(obj.location)
+        dropped = set(obj.attributes.get(FILE_ATTRIBUTES, default=None) or ())
+        dropped.difference_update(entry['attributes'])
+        for name in dropped:
+            obj.attributes.remove(name)
+        if not entry['attributes']:
+            obj.attributes.remove(FILE_ATTRIBUTES)
+        obj.attributes.batch_add(*_file_attributes(entry))
+        location = rooms.get(entry.get('location'))
+        if location and obj.location != location and _lies_in_room(obj):
+            obj.move_to(location, quiet=True, move_type="teleport")
+        destination = rooms.get(entry.get('destination'))
+        if destination and obj.destination != destination:
+            obj.destination = destination
+        obj.tags.remove(category=HASH_TAG_CATEGORY)
+        obj.tags.add(entry['hash'], category=HASH_TAG_CATEGORY)
+
+    def _delete(self, obj):
+        """Delete obj, unless a player is in it or carries it"""
+        if not obj.pk:
+            # already deleted along with its room
+            return
+        if any(content.has_account for content in obj.contents) or not _lies_in_room(obj):
+            self.skipped.append(obj)
+            return
+        obj.delete()
+
+
+def sync_zone(name):
+    """
+    Apply every difference between the zone file called name and the
+    live world.
+
+    Returns:
+        ZoneSync: The applied changes.
+    """
+    sync = ZoneSync(name)
+    sync.apply()
+    return sync